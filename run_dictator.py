@@ -24,4 +24,7 @@ if bundle:
 from dictator.main import main
 
 if __name__ == "__main__":
+    # Lets the bundled executable act as a spawned Whisper worker
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -41,7 +41,6 @@ OPTIONS = {
         'pynput',
         'sounddevice',
         'numpy',
-        'pydub',
         'pywhispercpp',
         'PyQt6',
         'dictator',
@@ -76,10 +76,17 @@ class DictatorApp(rumps.App):
         self.transcriber = WhisperTranscriber(
             model_name=self.config.whisper_model,
             n_threads=self.config.whisper_threads,
+            quantization=self.config.whisper_quantization,
+            isolate_process=self.config.whisper_process_isolation,
             custom_vocabulary=self.config.custom_vocabulary,
         )
         self.inserter = TextInserter()
         self.storage = RecordingStorage(self.config.recordings_dir)
+        threading.Thread(
+            target=self.storage.prune_converted,
+            name="prune-converted",
+            daemon=True,
+        ).start()
 
         # Initialize LLM corrector if enabled
         self.llm_corrector = None
@@ -142,8 +149,6 @@ class DictatorApp(rumps.App):
         self._register_health_monitoring()
         self.health_monitor.start_monitoring(check_interval=5.0)
 
-        threading.Thread(target=self.transcriber.load_model, daemon=True).start()
-
         logger.info("Dictator app initialized")
 
     def _update_ui_safe(self, callback):
@@ -453,6 +458,7 @@ class DictatorApp(rumps.App):
                     aws_profile=self.config.aws_profile if self.config.aws_profile else None,
                     region=self.config.bedrock_region,
                     custom_vocabulary=self.config.custom_vocabulary,
+                    min_words_for_llm=self.config.llm_min_words,
                 )
                 logger.info("LLM corrector initialized successfully")
             else:
@@ -473,16 +479,17 @@ class DictatorApp(rumps.App):
             new_config.save(self.config_path)
             self.config = new_config
 
-            # Update Whisper transcriber if model, threads, or vocabulary changed
+            # Update Whisper transcriber if model or threads changed
             if (new_config.whisper_model != self.transcriber.model_name or
-                new_config.whisper_threads != self.transcriber.n_threads or
-                new_config.custom_vocabulary != self.transcriber.custom_vocabulary):
+                new_config.whisper_threads != self.transcriber.configured_threads or
+                new_config.whisper_quantization != self.transcriber.quantization or
+                new_config.whisper_process_isolation != self.transcriber.isolate_process):
                 logger.info(
                     "Whisper settings changed, reinitializing",
                     extra={
                         "old_model": self.transcriber.model_name,
                         "new_model": new_config.whisper_model,
-                        "old_threads": self.transcriber.n_threads,
+                        "old_threads": self.transcriber.configured_threads,
                         "new_threads": new_config.whisper_threads,
                         "vocab_count": len(new_config.custom_vocabulary),
                     }
@@ -490,12 +497,16 @@ class DictatorApp(rumps.App):
                 self.transcriber = WhisperTranscriber(
                     model_name=new_config.whisper_model,
                     n_threads=new_config.whisper_threads,
+                    quantization=new_config.whisper_quantization,
+                    isolate_process=new_config.whisper_process_isolation,
                     custom_vocabulary=new_config.custom_vocabulary,
                 )
                 logger.info(
                     f"✓ Whisper transcriber initialized with model: {new_config.whisper_model}"
                 )
-                threading.Thread(target=self.transcriber.load_model, daemon=True).start()
+            elif new_config.custom_vocabulary != self.transcriber.custom_vocabulary:
+                # Vocabulary only affects the prompt, so keep the loaded model
+                self.transcriber.set_vocabulary(new_config.custom_vocabulary)
 
             # Reinitialize LLM corrector if settings changed
             if new_config.llm_correction_enabled:
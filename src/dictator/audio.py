@@ -15,6 +15,31 @@ import threading
 logger = logging.getLogger(__name__)
 
 
+def compute_chunk_rms(chunks: List[np.ndarray]) -> np.ndarray:
+    """Compute the RMS level of each int16 audio chunk in one vectorized pass.
+
+    Args:
+        chunks: List of int16 audio chunks (any length)
+
+    Returns:
+        Array with one RMS value (0.0 to 1.0) per chunk; empty chunks get 0.0
+    """
+    lengths = np.fromiter((len(chunk) for chunk in chunks), dtype=np.int64, count=len(chunks))
+    offsets = np.zeros(len(chunks), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+
+    rms = np.zeros(len(chunks), dtype=np.float64)
+    # reduceat can't express an empty range, so only reduce non-empty chunks
+    nonempty = lengths > 0
+    if not nonempty.any():
+        return rms
+
+    samples = np.concatenate(chunks, axis=0).ravel().astype(np.float32) / 32768.0
+    sums = np.add.reduceat(samples * samples, offsets[nonempty])
+    rms[nonempty] = np.sqrt(sums / lengths[nonempty])
+    return rms
+
+
 class AudioRecorder:
     """Records audio from microphone.
 
@@ -374,12 +399,7 @@ class AudioRecorder:
         min_silent_chunks = int(min_silence_duration / chunk_duration)
 
         # Analyze each chunk for voice activity
-        voice_activity = []
-        for chunk in audio_data:
-            # Calculate RMS for chunk
-            audio_float = chunk.astype(np.float32) / 32768.0
-            rms = np.sqrt(np.mean(audio_float ** 2))
-            voice_activity.append(rms >= threshold)
+        voice_activity = (compute_chunk_rms(audio_data) >= threshold).tolist()
 
         # Find segments to keep (voice + short silences)
         segments_to_keep = []
@@ -5,6 +5,7 @@ Listens for Option+Space keyboard combination system-wide.
 
 from typing import Callable, Set
 import logging
+import time
 from pynput import keyboard
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,6 @@ def _prewarm_hiservices() -> None:
     try:
         import platform
         if platform.system() == "Darwin":
-            import time
             # Import the module and force the lazy loading to complete
             from Quartz import HIServices
 
@@ -102,8 +102,6 @@ class HotkeyListener:
 
     def start(self) -> None:
         """Start listening for hotkey in background thread with retry logic."""
-        import time
-
         # Pre-warm HIServices to avoid race condition
         _prewarm_hiservices()
 
@@ -7,17 +7,35 @@ Uses multiple strategies for reliable text insertion:
 """
 
 import logging
+import threading
 import time
-from AppKit import NSPasteboard, NSStringPboardType
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+from AppKit import NSPasteboard, NSPasteboardItem, NSStringPboardType, NSWorkspace
 from ApplicationServices import (
+    AXObserverAddNotification,
+    AXObserverCreate,
+    AXObserverGetRunLoopSource,
+    AXObserverRemoveNotification,
     AXUIElementCreateSystemWide,
     AXUIElementCopyAttributeValue,
+    AXUIElementCopyMultipleAttributeValues,
+    AXUIElementGetPid,
     AXUIElementSetAttributeValue,
+    AXValueGetType,
+    kAXValueAXErrorType,
+    kAXValueChangedNotification,
     kAXErrorSuccess,
     kAXErrorAPIDisabled,
     kAXErrorNotImplemented,
     kAXErrorInvalidUIElement,
 )
+from CoreFoundation import (
+    CFRunLoopAddSource,
+    CFRunLoopGetCurrent,
+    CFRunLoopRemoveSource,
+    CFRunLoopRunInMode,
+)
 from Quartz import (
     CGEventCreateKeyboardEvent,
     CGEventPost,
@@ -37,6 +55,42 @@ ERROR_MESSAGES = {
 # Virtual key code for 'V' key
 V_KEY_CODE = 9
 
+# Apps known to falsely report AX insertion success (Chromium/Electron).
+# These go straight to clipboard paste.
+CLIPBOARD_ONLY_BUNDLE_IDS = frozenset({
+    "com.google.Chrome",
+    "com.google.Chrome.canary",
+    "com.brave.Browser",
+    "com.microsoft.edgemac",
+    "com.microsoft.VSCode",
+    "com.tinyspeck.slackmacgap",
+    "com.hnc.Discord",
+    "com.microsoft.teams2",
+    "notion.id",
+})
+CLIPBOARD_ONLY_BUNDLE_PREFIXES = ("com.electron.",)
+
+# After the AX strategies fail in an app, this many insertions there go
+# straight to clipboard paste before AX is tried again
+CLIPBOARD_FALLBACK_USES = 10
+
+# Attributes read up front in a single AX round-trip
+PREFETCH_ATTRIBUTES = ("AXValue", "AXSelectedTextRange")
+
+# How long to wait for kAXValueChangedNotification before re-reading AXValue
+VERIFY_TIMEOUT = 0.05
+
+# Upper bound on waiting for the target app to consume a Cmd+V paste
+PASTE_TIMEOUT = 0.05
+
+# Private run loop mode so waiting for AX notifications never services
+# unrelated sources (e.g. Qt events when called from the main thread)
+VERIFY_RUN_LOOP_MODE = "DictatorAXVerifyMode"
+
+
+def _on_ax_notification(observer, element, notification, refcon):
+    """AXObserver callback - firing the source is enough to wake the run loop."""
+
 
 class TextInserter:
     """Inserts text into the currently focused application.
@@ -47,6 +101,38 @@ class TextInserter:
     3. Fallback to clipboard+paste (universal compatibility)
     """
 
+    def __init__(self) -> None:
+        """Initialize text inserter."""
+        # AXObserver for the most recently targeted app, reused across insertions
+        self._observer = None
+        self._observer_pid = None
+        # Serializes use of the observer between callers and the restore thread
+        self._observer_lock = threading.Lock()
+
+        # Held from clipboard snapshot until the original contents are
+        # restored, so back-to-back pastes never snapshot our own text
+        self._pasteboard_lock = threading.Lock()
+
+        # Snapshot written back by the last restore, reused while the
+        # pasteboard's changeCount shows nobody has touched it since
+        self._restored_snapshot = None
+        self._restored_change_count = None
+
+        # Bundle ID -> insertions left that skip AX, for apps where only
+        # clipboard paste worked recently (see CLIPBOARD_FALLBACK_USES)
+        self._clipboard_fallbacks: dict[str, int] = {}
+
+        # Single worker so async insertions run off the caller's thread
+        # but never interleave their AX/clipboard IPC
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="text-insert"
+        )
+
+        # Cmd+V event pair, built once and re-posted on every paste
+        self._paste_key_down = CGEventCreateKeyboardEvent(None, V_KEY_CODE, True)
+        CGEventSetFlags(self._paste_key_down, kCGEventFlagMaskCommand)
+        self._paste_key_up = CGEventCreateKeyboardEvent(None, V_KEY_CODE, False)
+
     def insert_text(self, text: str) -> bool:
         """Insert text at current cursor position using best available method.
 
@@ -60,34 +146,122 @@ class TextInserter:
             logger.warning("Empty text provided for insertion")
             return False
 
-        # Strategy 1: Try kAXSelectedTextAttribute (best for native apps)
-        if self._insert_via_selected_text(text):
-            logger.info(
-                "Text inserted via kAXSelectedTextAttribute",
-                extra={"text_length": len(text), "method": "selected_text"}
-            )
-            return True
+        bundle_id = self._get_frontmost_bundle_id()
 
-        # Strategy 2: Try kAXValue (fallback for simple fields)
-        if self._insert_via_value(text):
-            logger.info(
-                "Text inserted via kAXValue",
-                extra={"text_length": len(text), "method": "value"}
-            )
-            return True
+        # Chromium/Electron apps falsely report AX success - go straight to paste.
+        # Same, for a limited number of insertions, where AX recently failed.
+        if self._is_clipboard_only_app(bundle_id) or self._use_clipboard_fallback(bundle_id):
+            logger.debug("Skipping AX strategies for %s", bundle_id)
+            focused_element, error_code = None, None
+        else:
+            # Look up the focused element once and share it across the AX
+            # strategies - each lookup is two cross-process round-trips
+            focused_element, error_code = self._get_focused_element()
+
+        ax_attempted = error_code == kAXErrorSuccess
+        if ax_attempted:
+            # Get value and selection before insertion to verify/append later
+            value_before, current_range = self._get_value_and_range(focused_element)
+
+            # Strategy 1: Try kAXSelectedTextAttribute (best for native apps)
+            if self._insert_via_selected_text(
+                focused_element, value_before, current_range, text
+            ):
+                logger.info(
+                    "Text inserted via kAXSelectedTextAttribute",
+                    extra={"text_length": len(text), "method": "selected_text"}
+                )
+                return True
+
+            # Strategy 2: Try kAXValue (fallback for simple fields)
+            if self._insert_via_value(focused_element, value_before, text):
+                logger.info(
+                    "Text inserted via kAXValue",
+                    extra={"text_length": len(text), "method": "value"}
+                )
+                return True
+        elif error_code is not None:
+            logger.debug("Cannot get focused element: %s", error_code)
 
         # Strategy 3: Universal clipboard+paste (works everywhere)
-        if self._insert_via_clipboard_paste(text):
+        if self._insert_via_clipboard_paste(
+            text, focused_element if ax_attempted else None
+        ):
+            # Only remember when the AX strategies actually ran and failed,
+            # not when the focused element was momentarily unavailable
+            if ax_attempted and bundle_id:
+                self._clipboard_fallbacks[bundle_id] = CLIPBOARD_FALLBACK_USES
             logger.info(
                 "Text inserted via clipboard paste",
                 extra={"text_length": len(text), "method": "clipboard"}
             )
             return True
 
+        self._clipboard_fallbacks.pop(bundle_id, None)
         logger.error("All text insertion methods failed")
         return False
 
-    def _get_focused_element(self):
+    def _use_clipboard_fallback(self, bundle_id: Optional[str]) -> bool:
+        """Check whether to skip AX for an app, using up one remembered skip.
+
+        Args:
+            bundle_id: Bundle identifier of the target app (or None)
+
+        Returns:
+            True if AX recently failed in this app and skips remain
+        """
+        uses_left = self._clipboard_fallbacks.get(bundle_id, 0)
+        if not uses_left:
+            return False
+        if uses_left == 1:
+            del self._clipboard_fallbacks[bundle_id]  # Try AX again next time
+        else:
+            self._clipboard_fallbacks[bundle_id] = uses_left - 1
+        return True
+
+    def insert_text_async(self, text: str) -> Future:
+        """Insert text on a background worker thread.
+
+        Use from the UI thread so slow AX targets don't block it.
+
+        Args:
+            text: Text to insert
+
+        Returns:
+            Future resolving to the insert_text() result
+        """
+        return self._executor.submit(self.insert_text, text)
+
+    def _get_frontmost_bundle_id(self) -> Optional[str]:
+        """Get the bundle identifier of the frontmost application.
+
+        Returns:
+            Bundle ID string, or None if unavailable
+        """
+        try:
+            app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            return app.bundleIdentifier() if app else None
+        except Exception as e:
+            logger.debug("Cannot get frontmost application: %s", e)
+            return None
+
+    def _is_clipboard_only_app(self, bundle_id: Optional[str]) -> bool:
+        """Check if an app is known to need clipboard paste.
+
+        Args:
+            bundle_id: Bundle identifier of the target app (or None)
+
+        Returns:
+            True if AX strategies should be skipped
+        """
+        if not bundle_id:
+            return False
+        return (
+            bundle_id in CLIPBOARD_ONLY_BUNDLE_IDS
+            or bundle_id.startswith(CLIPBOARD_ONLY_BUNDLE_PREFIXES)
+        )
+
+    def _get_focused_element(self) -> tuple[Any, int]:
         """Get the currently focused UI element.
 
         Returns:
@@ -111,7 +285,55 @@ class TextInserter:
 
         return focused_element, kAXErrorSuccess
 
-    def _insert_via_selected_text(self, text: str) -> bool:
+    def _get_value_and_range(self, element: Any) -> tuple[Any, Any]:
+        """Read AXValue and AXSelectedTextRange of an element.
+
+        Both attributes are fetched with one
+        AXUIElementCopyMultipleAttributeValues call to halve the IPC
+        round-trips to the target app.
+
+        Args:
+            element: The UI element
+
+        Returns:
+            Tuple of (value, selected_range); either is None if unavailable
+        """
+        try:
+            error_code, values = AXUIElementCopyMultipleAttributeValues(
+                element, PREFETCH_ATTRIBUTES, 0, None
+            )
+        except Exception as e:
+            logger.debug("Exception reading AX attributes: %s", e)
+            return None, None
+
+        if error_code != kAXErrorSuccess or values is None:
+            return None, None
+
+        value, current_range = (
+            None if self._is_ax_error(v) else v for v in values
+        )
+        return value, current_range
+
+    def _is_ax_error(self, value: Any) -> bool:
+        """Check if a batch-fetched attribute value is an AXError placeholder.
+
+        Args:
+            value: Value returned by AXUIElementCopyMultipleAttributeValues
+
+        Returns:
+            True if the attribute could not be read
+        """
+        if value is None:
+            return True
+        try:
+            return AXValueGetType(value) == kAXValueAXErrorType
+        except Exception:
+            # Not an AXValueRef (e.g. a plain string value)
+            return False
+
+    def _insert_via_selected_text(
+        self, focused_element: Any, value_before: Any, current_range: Any, text: str
+    ) -> bool:
         """Insert text using kAXSelectedTextAttribute.
 
         This method inserts at the cursor position without replacing
@@ -121,25 +343,15 @@ class TextInserter:
         don't actually insert text. We verify by reading back the value.
 
         Args:
+            focused_element: The focused UI element
+            value_before: AXValue of the element before insertion (or None)
+            current_range: AXSelectedTextRange before insertion (or None)
             text: Text to insert
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            focused_element, error_code = self._get_focused_element()
-
-            if error_code != kAXErrorSuccess:
-                logger.debug(
-                    f"Cannot get focused element for selected text: {error_code}"
-                )
-                return False
-
-            # Get value before insertion to verify later
-            _, value_before = AXUIElementCopyAttributeValue(
-                focused_element, "AXValue", None
-            )
-
             # Try to set selected text directly
             error_code = AXUIElementSetAttributeValue(
                 focused_element, "AXSelectedText", text
@@ -155,13 +367,9 @@ class TextInserter:
                     )
                     return False
 
-            # If that didn't work, try getting current selection range
-            # and setting it to insert text at cursor
-            error_code, current_range = AXUIElementCopyAttributeValue(
-                focused_element, "AXSelectedTextRange", None
-            )
-
-            if error_code == kAXErrorSuccess and current_range is not None:
+            # If that didn't work, retry at the current selection range
+            # to insert text at cursor
+            if current_range is not None:
                 # Set text at current selection (replaces selection or inserts)
                 error_code = AXUIElementSetAttributeValue(
                     focused_element, "AXSelectedText", text
@@ -177,15 +385,15 @@ class TextInserter:
                         return False
 
             logger.debug(
-                f"kAXSelectedText insertion failed with error: {error_code}"
+                "kAXSelectedText insertion failed with error: %s", error_code
             )
             return False
 
         except Exception as e:
-            logger.debug(f"Exception in _insert_via_selected_text: {e}")
+            logger.debug("Exception in _insert_via_selected_text: %s", e)
             return False
 
-    def _verify_insertion(self, element, inserted_text: str, value_before) -> bool:
+    def _verify_insertion(self, element: Any, inserted_text: str, value_before: Any) -> bool:
         """Verify that text was actually inserted.
 
         Some apps falsely report success. We check if the value changed.
@@ -199,13 +407,18 @@ class TextInserter:
             True if insertion verified, False otherwise
         """
         try:
-            # Small delay to let the insertion complete
-            time.sleep(0.01)
-
             error_code, value_after = AXUIElementCopyAttributeValue(
                 element, "AXValue", None
             )
 
+            if error_code == kAXErrorSuccess and value_before == value_after:
+                # Slow apps apply the change asynchronously - wait for
+                # kAXValueChangedNotification (or timeout) and read again
+                self._wait_for_value_change(element)
+                error_code, value_after = AXUIElementCopyAttributeValue(
+                    element, "AXValue", None
+                )
+
             if error_code != kAXErrorSuccess:
                 # Can't verify, but don't fail - some fields don't support AXValue
                 logger.debug("Cannot verify insertion - AXValue not supported")
@@ -218,40 +431,101 @@ class TextInserter:
 
             # Value didn't change - likely false success
             logger.debug(
-                f"Value unchanged after insertion (before: {value_before}, after: {value_after})"
+                "Value unchanged after insertion (before: %s, after: %s)",
+                value_before,
+                value_after,
             )
             return False
 
         except Exception as e:
-            logger.debug(f"Exception during verification: {e}")
+            logger.debug("Exception during verification: %s", e)
             # Can't verify, assume success to avoid false negatives
             return True
 
-    def _insert_via_value(self, text: str) -> bool:
+    def _get_observer(self, element: Any) -> Any:
+        """Get an AXObserver for the app owning the element.
+
+        The observer is cached and only recreated when the target app changes.
+
+        Args:
+            element: The UI element
+
+        Returns:
+            AXObserver, or None if one can't be created
+        """
+        error_code, pid = AXUIElementGetPid(element, None)
+        if error_code != kAXErrorSuccess:
+            return None
+
+        if self._observer is None or self._observer_pid != pid:
+            error_code, observer = AXObserverCreate(pid, _on_ax_notification, None)
+            if error_code != kAXErrorSuccess:
+                return None
+            self._observer = observer
+            self._observer_pid = pid
+
+        return self._observer
+
+    def _wait_for_value_change(
+        self, element: Any, timeout: float = VERIFY_TIMEOUT, fallback_delay: float = 0.01
+    ) -> None:
+        """Block until the element posts kAXValueChangedNotification.
+
+        Returns early when the notification arrives, otherwise after
+        timeout. Sleeps for fallback_delay instead if the observer can't
+        be registered.
+
+        Args:
+            element: The UI element
+            timeout: Maximum time to wait for the notification (seconds)
+            fallback_delay: Fixed delay used when observing isn't possible
+        """
+        with self._observer_lock:
+            self._wait_for_value_change_locked(element, timeout, fallback_delay)
+
+    def _wait_for_value_change_locked(
+        self, element: Any, timeout: float, fallback_delay: float
+    ) -> None:
+        """Body of _wait_for_value_change; caller must hold _observer_lock."""
+        observer = self._get_observer(element)
+        if observer is None:
+            time.sleep(fallback_delay)
+            return
+
+        error_code = AXObserverAddNotification(
+            observer, element, kAXValueChangedNotification, None
+        )
+        if error_code != kAXErrorSuccess:
+            time.sleep(fallback_delay)
+            return
+
+        run_loop = CFRunLoopGetCurrent()
+        source = AXObserverGetRunLoopSource(observer)
+        CFRunLoopAddSource(run_loop, source, VERIFY_RUN_LOOP_MODE)
+        try:
+            CFRunLoopRunInMode(VERIFY_RUN_LOOP_MODE, timeout, True)
+        finally:
+            CFRunLoopRemoveSource(run_loop, source, VERIFY_RUN_LOOP_MODE)
+            AXObserverRemoveNotification(
+                observer, element, kAXValueChangedNotification
+            )
+
+    def _insert_via_value(self, focused_element: Any, current_value: Any, text: str) -> bool:
         """Insert text using kAXValue attribute.
 
         This method appends text to the existing value. Works with
         simple text fields but not rich text editors.
 
         Args:
+            focused_element: The focused UI element
+            current_value: Current AXValue of the element (or None)
             text: Text to insert
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            focused_element, error_code = self._get_focused_element()
-
-            if error_code != kAXErrorSuccess:
-                logger.debug(f"Cannot get focused element for value: {error_code}")
-                return False
-
-            # Get current value
-            error_code, current_value = AXUIElementCopyAttributeValue(
-                focused_element, "AXValue", None
-            )
-
-            if error_code == kAXErrorSuccess and current_value is not None:
+            if current_value is not None:
                 new_value = str(current_value) + text
             else:
                 new_value = text
@@ -264,14 +538,14 @@ class TextInserter:
             if error_code == kAXErrorSuccess:
                 return True
 
-            logger.debug(f"kAXValue insertion failed with error: {error_code}")
+            logger.debug("kAXValue insertion failed with error: %s", error_code)
             return False
 
         except Exception as e:
-            logger.debug(f"Exception in _insert_via_value: {e}")
+            logger.debug("Exception in _insert_via_value: %s", e)
             return False
 
-    def _insert_via_clipboard_paste(self, text: str) -> bool:
+    def _insert_via_clipboard_paste(self, text: str, focused_element: Any = None) -> bool:
         """Insert text by copying to clipboard and simulating Cmd+V.
 
         This is the most reliable method and works with all applications
@@ -280,15 +554,20 @@ class TextInserter:
 
         Args:
             text: Text to insert
+            focused_element: Optional focused UI element, used to detect
+                when the paste lands instead of waiting a fixed delay
 
         Returns:
             True if successful, False otherwise
         """
+        # Wait for any previous paste to finish restoring the clipboard
+        self._pasteboard_lock.acquire()
+
         try:
             pasteboard = NSPasteboard.generalPasteboard()
 
-            # Save current clipboard contents
-            old_contents = pasteboard.stringForType_(NSStringPboardType)
+            # Save current clipboard contents (all types, not just text)
+            old_contents = self._snapshot_pasteboard(pasteboard)
 
             # Set text to clipboard
             pasteboard.clearContents()
@@ -296,40 +575,118 @@ class TextInserter:
 
             if not success:
                 logger.error("Failed to set clipboard contents")
+                self._pasteboard_lock.release()
                 return False
 
-            # Small delay to ensure clipboard is ready
-            time.sleep(0.02)
+            # Make sure the new contents are readable before pasting
+            for _ in range(5):
+                if pasteboard.stringForType_(NSStringPboardType) == text:
+                    break
+                time.sleep(0.001)
 
             # Send Cmd+V keystroke
             self._send_paste_keystroke()
 
-            # Wait for paste to complete
-            time.sleep(0.05)
+        except Exception as e:
+            logger.error("Clipboard paste failed: %s", e)
+            self._pasteboard_lock.release()
+            return False
+
+        # Restore original contents in the background so the caller
+        # doesn't wait for the target app to consume the paste
+        threading.Thread(
+            target=self._restore_clipboard,
+            args=(pasteboard, old_contents, focused_element),
+            daemon=True,
+        ).start()
+
+        return True
+
+    def _restore_clipboard(
+        self, pasteboard: Any, old_contents: list[dict], focused_element: Any
+    ) -> None:
+        """Restore clipboard contents once the paste has completed.
+
+        Runs on a background thread and releases the pasteboard lock
+        taken by _insert_via_clipboard_paste.
+
+        Args:
+            pasteboard: The general pasteboard
+            old_contents: Snapshot from _snapshot_pasteboard (may be empty)
+            focused_element: Optional focused UI element to watch for the paste
+        """
+        try:
+            # Wait for paste to complete before touching the clipboard again
+            if focused_element is not None:
+                self._wait_for_value_change(
+                    focused_element, timeout=PASTE_TIMEOUT, fallback_delay=PASTE_TIMEOUT
+                )
+            else:
+                time.sleep(PASTE_TIMEOUT)
 
             # Restore original clipboard contents
             if old_contents:
                 pasteboard.clearContents()
-                pasteboard.setString_forType_(old_contents, NSStringPboardType)
-
-            return True
+                pasteboard.writeObjects_(self._build_pasteboard_items(old_contents))
+                self._restored_snapshot = old_contents
+                self._restored_change_count = pasteboard.changeCount()
 
         except Exception as e:
-            logger.error(f"Clipboard paste failed: {e}")
-            return False
+            logger.error("Clipboard restore failed: %s", e)
 
-    def _send_paste_keystroke(self):
-        """Send Cmd+V keystroke to active application.
+        finally:
+            self._pasteboard_lock.release()
 
-        Simulates pressing Command+V to trigger paste action.
+    def _snapshot_pasteboard(self, pasteboard: Any) -> list[dict]:
+        """Capture every item and type currently on the pasteboard.
+
+        Args:
+            pasteboard: The general pasteboard
+
+        Returns:
+            List of {type: data} dicts, one per pasteboard item
         """
-        # Create key down event with Command modifier
-        key_down = CGEventCreateKeyboardEvent(None, V_KEY_CODE, True)
-        CGEventSetFlags(key_down, kCGEventFlagMaskCommand)
+        if pasteboard.changeCount() == self._restored_change_count:
+            # Unchanged since our last restore - skip re-reading the data
+            return self._restored_snapshot
+
+        items = pasteboard.pasteboardItems()
+        if not items:
+            return []
+
+        snapshot = []
+        for item in items:
+            item_data = {}
+            for pb_type in item.types():
+                data = item.dataForType_(pb_type)
+                if data is not None:
+                    item_data[pb_type] = data
+            if item_data:
+                snapshot.append(item_data)
+        return snapshot
+
+    def _build_pasteboard_items(self, snapshot: list[dict]) -> list:
+        """Recreate pasteboard items from a snapshot.
 
-        # Create key up event
-        key_up = CGEventCreateKeyboardEvent(None, V_KEY_CODE, False)
+        Args:
+            snapshot: List of {type: data} dicts from _snapshot_pasteboard
 
-        # Post events to system
-        CGEventPost(kCGHIDEventTap, key_down)
-        CGEventPost(kCGHIDEventTap, key_up)
+        Returns:
+            List of NSPasteboardItem ready for writeObjects_
+        """
+        items = []
+        for item_data in snapshot:
+            item = NSPasteboardItem.alloc().init()
+            for pb_type, data in item_data.items():
+                item.setData_forType_(data, pb_type)
+            items.append(item)
+        return items
+
+    def _send_paste_keystroke(self) -> None:
+        """Send Cmd+V keystroke to active application.
+
+        Simulates pressing Command+V to trigger paste action.
+        """
+        # Post prebuilt key down/up events to system
+        CGEventPost(kCGHIDEventTap, self._paste_key_down)
+        CGEventPost(kCGHIDEventTap, self._paste_key_up)
@@ -3,16 +3,17 @@
 This module defines the core data structures used throughout the application.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import json
+import os
 
 from dictator.services.llm_corrector import DEFAULT_CORRECTION_PROMPT
 
 
-@dataclass
+@dataclass(slots=True)
 class Recording:
     """Represents a single voice recording and its transcription.
 
@@ -29,6 +30,11 @@ class Recording:
     transcription: str
     cleaned_transcription: Optional[str] = None
 
+    @property
+    def display_text(self) -> str:
+        """Text to show and copy: the cleaned version if available."""
+        return self.cleaned_transcription or self.transcription
+
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
         return {
@@ -51,6 +57,10 @@ class Recording:
         )
 
 
+# Parsed configs keyed by path, with the file mtime they were read at
+_config_cache: dict[Path, tuple[int, "AppConfig"]] = {}
+
+
 @dataclass
 class AppConfig:
     """Application configuration.
@@ -58,7 +68,9 @@ class AppConfig:
     Attributes:
         recordings_dir: Where to store audio files and metadata
         whisper_model: Model name for whisper.cpp
-        whisper_threads: Number of threads for transcription
+        whisper_threads: Number of threads for transcription (0 = auto-detect)
+        whisper_quantization: GGML quantization for the model ("" = full precision)
+        whisper_process_isolation: Run Whisper in a separate worker process
         custom_vocabulary: List of custom words, names, technical terms
         llm_correction_enabled: Whether to use LLM for transcript correction
         llm_provider: LLM provider to use (currently only "bedrock")
@@ -66,13 +78,17 @@ class AppConfig:
         bedrock_model: Bedrock model identifier
         bedrock_region: AWS region for Bedrock
         correction_prompt: System prompt for LLM correction
+        llm_min_words: Transcripts with fewer words skip the LLM and only get
+            capitalization and a full stop (0 = always use the LLM)
         remove_silence_enabled: Whether to remove silence before processing
         silence_threshold: RMS threshold for detecting silence (0-1)
         min_silence_duration: Minimum silence duration to remove (seconds)
     """
     recordings_dir: Path
     whisper_model: str = "large-v3-turbo"
-    whisper_threads: int = 8
+    whisper_threads: int = 0
+    whisper_quantization: str = "q5_0"
+    whisper_process_isolation: bool = False
     custom_vocabulary: list[str] = field(default_factory=list)
     llm_correction_enabled: bool = False
     llm_provider: str = "bedrock"
@@ -80,6 +96,7 @@ class AppConfig:
     bedrock_model: str = "us.anthropic.claude-haiku-4-5-20251001-v1:0"
     bedrock_region: str = "us-east-1"
     correction_prompt: str = field(default_factory=lambda: DEFAULT_CORRECTION_PROMPT)
+    llm_min_words: int = 3
     remove_silence_enabled: bool = False  # Disabled by default for safety
     silence_threshold: float = 0.01  # Same as voice detection threshold
     min_silence_duration: float = 0.5  # Remove silence longer than 500ms
@@ -98,6 +115,8 @@ class AppConfig:
             "recordings_dir": str(self.recordings_dir),
             "whisper_model": self.whisper_model,
             "whisper_threads": self.whisper_threads,
+            "whisper_quantization": self.whisper_quantization,
+            "whisper_process_isolation": self.whisper_process_isolation,
             "custom_vocabulary": self.custom_vocabulary,
             "llm_correction_enabled": self.llm_correction_enabled,
             "llm_provider": self.llm_provider,
@@ -105,26 +124,43 @@ class AppConfig:
             "bedrock_model": self.bedrock_model,
             "bedrock_region": self.bedrock_region,
             "correction_prompt": self.correction_prompt,
+            "llm_min_words": self.llm_min_words,
             "remove_silence_enabled": self.remove_silence_enabled,
             "silence_threshold": self.silence_threshold,
             "min_silence_duration": self.min_silence_duration,
         }
-        with open(path, "w") as f:
+        # Write to a temp file and rename so a crash can't leave a torn config
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+        _config_cache.pop(path, None)
 
     @classmethod
     def load(cls, path: Path) -> "AppConfig":
-        """Load configuration from JSON file."""
-        if not path.exists():
+        """Load configuration from JSON file.
+
+        Parsed configs are cached until the file's mtime changes.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
             return cls.default()
 
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return replace(cached[1], custom_vocabulary=list(cached[1].custom_vocabulary))
+
         with open(path, "r") as f:
             data = json.load(f)
 
-        return cls(
+        config = cls(
             recordings_dir=Path(data["recordings_dir"]),
             whisper_model=data.get("whisper_model", "large-v3-turbo"),
-            whisper_threads=data.get("whisper_threads", 8),
+            whisper_threads=data.get("whisper_threads", 0),
+            whisper_quantization=data.get("whisper_quantization", "q5_0"),
+            whisper_process_isolation=data.get("whisper_process_isolation", False),
             custom_vocabulary=data.get("custom_vocabulary", []),
             llm_correction_enabled=data.get("llm_correction_enabled", False),
             llm_provider=data.get("llm_provider", "bedrock"),
@@ -132,7 +168,10 @@ class AppConfig:
             bedrock_model=data.get("bedrock_model", "us.anthropic.claude-haiku-4-5-20251001-v1:0"),
             bedrock_region=data.get("bedrock_region", "us-east-1"),
             correction_prompt=data.get("correction_prompt", DEFAULT_CORRECTION_PROMPT),
+            llm_min_words=data.get("llm_min_words", 3),
             remove_silence_enabled=data.get("remove_silence_enabled", False),
             silence_threshold=data.get("silence_threshold", 0.01),
             min_silence_duration=data.get("min_silence_duration", 0.5),
         )
+        _config_cache[path] = (mtime, config)
+        return replace(config, custom_vocabulary=list(config.custom_vocabulary))
@@ -4,13 +4,28 @@ Converts various audio formats (M4A, MP3, OGG, etc.) to WAV for Whisper.
 """
 
 import logging
+import shutil
+import struct
+import subprocess
+import wave
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 # Supported input formats
-SUPPORTED_FORMATS = {".m4a", ".mp3", ".wav", ".ogg", ".mp4", ".flac", ".aac"}
+SUPPORTED_FORMATS = frozenset({".m4a", ".mp3", ".wav", ".ogg", ".mp4", ".flac", ".aac"})
+
+# Precomputed lookups so format checks don't rebuild them per call
+_SUPPORTED_SUFFIXES = tuple(SUPPORTED_FORMATS)
+_SUPPORTED_FORMATS_STRING = ", ".join(
+    sorted(fmt.upper().lstrip(".") for fmt in SUPPORTED_FORMATS)
+)
+
+# Whisper expects 16kHz mono 16-bit PCM
+WHISPER_SAMPLE_RATE = 16000
 
 
 def is_supported_format(file_path: Path) -> bool:
@@ -22,7 +37,7 @@ def is_supported_format(file_path: Path) -> bool:
     Returns:
         True if format is supported
     """
-    return file_path.suffix.lower() in SUPPORTED_FORMATS
+    return str(file_path).lower().endswith(_SUPPORTED_SUFFIXES)
 
 
 def get_supported_formats_string() -> str:
@@ -31,8 +46,90 @@ def get_supported_formats_string() -> str:
     Returns:
         Comma-separated list of extensions (e.g., "M4A, MP3, WAV, OGG")
     """
-    formats = sorted([fmt.upper().lstrip(".") for fmt in SUPPORTED_FORMATS])
-    return ", ".join(formats)
+    return _SUPPORTED_FORMATS_STRING
+
+
+def _read_canonical_wav_header(path: Path) -> Optional[Tuple[int, int, int, float]]:
+    """Parse a canonical 44-byte PCM WAV header directly.
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        Tuple of (channels, sample_width, sample_rate, duration_seconds),
+        or None if the header isn't the canonical RIFF/fmt/data layout
+    """
+    with open(path, "rb") as f:
+        hdr = f.read(44)
+
+    if (
+        len(hdr) < 44
+        or hdr[0:4] != b"RIFF"
+        or hdr[8:16] != b"WAVEfmt "
+        or hdr[36:40] != b"data"
+    ):
+        return None
+
+    fmt_size, audio_format, channels, rate, byte_rate, _, bits = struct.unpack_from(
+        "<IHHIIHH", hdr, 16
+    )
+    if fmt_size != 16 or audio_format != 1 or byte_rate == 0:
+        return None
+
+    data_size = struct.unpack_from("<I", hdr, 40)[0]
+    return channels, bits // 8, rate, data_size / byte_rate
+
+
+def _read_wav_params(path: Path) -> Optional[Tuple[int, int, int, float]]:
+    """Read WAV header parameters without decoding audio.
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        Tuple of (channels, sample_width, sample_rate, duration_seconds),
+        or None if the file isn't a PCM WAV the wave module can read
+    """
+    # Fast path: fixed-offset header as written by our recorder
+    params = _read_canonical_wav_header(path)
+    if params is not None:
+        return params
+
+    # Extra chunks (e.g. ffmpeg's LIST) - let the wave module walk them
+    try:
+        with wave.open(str(path), "rb") as wf:
+            rate = wf.getframerate()
+            return (
+                wf.getnchannels(),
+                wf.getsampwidth(),
+                rate,
+                wf.getnframes() / float(rate),
+            )
+    except (wave.Error, EOFError):
+        return None
+
+
+def load_pcm_array(path: Path) -> Optional[np.ndarray]:
+    """Load a 16kHz mono 16-bit WAV as Whisper's float32 input.
+
+    Passing samples to whisper.cpp directly avoids pywhispercpp spawning
+    ffmpeg to decode the file again.
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        float32 samples in [-1, 1), or None if the file isn't 16kHz mono
+        16-bit PCM (caller should pass the path instead)
+    """
+    params = _read_wav_params(path)
+    if params is None or params[:3] != (1, 2, WHISPER_SAMPLE_RATE):
+        return None
+
+    with wave.open(str(path), "rb") as wf:
+        frames = wf.readframes(wf.getnframes())
+
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
 
 
 def convert_to_wav(
@@ -40,6 +137,9 @@ def convert_to_wav(
 ) -> Tuple[Path, float]:
     """Convert audio file to WAV format for Whisper.
 
+    WAV files that are already 16kHz mono 16-bit are returned as-is.
+    Everything else is resampled by streaming through ffmpeg.
+
     Args:
         input_path: Path to input audio file
         output_dir: Optional output directory (defaults to temp dir)
@@ -49,7 +149,7 @@ def convert_to_wav(
 
     Raises:
         ValueError: If format not supported
-        ImportError: If pydub not installed
+        RuntimeError: If ffmpeg is not installed
         Exception: If conversion fails
     """
     if not input_path.exists():
@@ -61,25 +161,18 @@ def convert_to_wav(
             f"Supported: {get_supported_formats_string()}"
         )
 
-    # If already WAV, just return it
+    # If already 16kHz mono 16-bit WAV, just return it (header read only)
     if input_path.suffix.lower() == ".wav":
-        logger.info(f"File already WAV format: {input_path}")
-        # Get duration using wave module
-        import wave
-
-        with wave.open(str(input_path), "rb") as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-            duration = frames / float(rate)
-        return input_path, duration
-
-    # Import pydub for conversion
-    try:
-        from pydub import AudioSegment
-    except ImportError:
-        raise ImportError(
-            "pydub is required for audio format conversion. "
-            "Install with: pip install pydub"
+        params = _read_wav_params(input_path)
+        if params is not None and params[:3] == (1, 2, WHISPER_SAMPLE_RATE):
+            logger.info(f"File already 16kHz mono WAV: {input_path}")
+            return input_path, params[3]
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError(
+            "ffmpeg is required for audio format conversion. "
+            "Install with: brew install ffmpeg"
         )
 
     logger.info(
@@ -87,12 +180,6 @@ def convert_to_wav(
         extra={"input": str(input_path)},
     )
 
-    # Load audio file
-    try:
-        audio = AudioSegment.from_file(str(input_path))
-    except Exception as e:
-        raise Exception(f"Failed to load audio file: {e}")
-
     # Prepare output path
     if output_dir is None:
         output_dir = input_path.parent
@@ -102,24 +189,41 @@ def convert_to_wav(
 
     output_path = output_dir / f"{input_path.stem}_converted.wav"
 
-    # Convert to WAV (16kHz mono for Whisper)
-    try:
-        # Whisper expects 16kHz mono
-        audio = audio.set_frame_rate(16000).set_channels(1)
-        audio.export(str(output_path), format="wav")
-
-        duration = len(audio) / 1000.0  # Convert ms to seconds
-
-        logger.info(
-            "Conversion complete",
-            extra={
-                "output": str(output_path),
-                "duration": duration,
-                "size_mb": output_path.stat().st_size / 1024 / 1024,
-            },
-        )
+    # Convert to WAV (16kHz mono for Whisper). ffmpeg streams the input,
+    # so memory use doesn't grow with file length.
+    result = subprocess.run(
+        [
+            ffmpeg,
+            "-nostdin",
+            "-y",
+            "-loglevel", "error",
+            "-i", str(input_path),
+            "-ar", str(WHISPER_SAMPLE_RATE),
+            "-ac", "1",
+            "-c:a", "pcm_s16le",
+            "-f", "wav",
+            str(output_path),
+        ],
+        capture_output=True,
+        text=True,
+    )
 
-        return output_path, duration
+    if result.returncode != 0:
+        raise Exception(f"Failed to convert audio: {result.stderr.strip()}")
+
+    params = _read_wav_params(output_path)
+    if params is None:
+        raise Exception(f"Failed to convert audio: unreadable output {output_path}")
+
+    duration = params[3]
+
+    logger.info(
+        "Conversion complete",
+        extra={
+            "output": str(output_path),
+            "duration": duration,
+            "size_mb": output_path.stat().st_size / 1024 / 1024,
+        },
+    )
 
-    except Exception as e:
-        raise Exception(f"Failed to convert audio: {e}")
+    return output_path, duration
@@ -5,6 +5,7 @@ for both live recordings and uploaded files.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -65,12 +66,17 @@ class AudioProcessor:
         self.storage = storage
         self.llm_corrector = llm_corrector
         self.inserter = inserter
+        # Single worker keeps metadata writes ordered
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="storage-io"
+        )
 
     def process(
         self,
         audio_path: Path,
         duration: float,
         progress_callback: Optional[Callable[[str], None]] = None,
+        segment_callback: Optional[Callable[[str], None]] = None,
     ) -> ProcessingResult:
         """Process audio file through complete pipeline.
 
@@ -78,6 +84,8 @@ class AudioProcessor:
             audio_path: Path to audio file (WAV format)
             duration: Audio duration in seconds
             progress_callback: Optional callback for status updates
+            segment_callback: Optional callback receiving raw transcript segments
+                as they are produced (for live display)
 
         Returns:
             ProcessingResult with transcription and insertion status
@@ -98,7 +106,7 @@ class AudioProcessor:
             extra={"audio_path": str(audio_path), "duration": duration},
         )
 
-        raw_text = self.transcriber.transcribe(audio_path)
+        raw_text = self.transcriber.transcribe_async(audio_path, segment_callback).result()
         cleaned_text = raw_text
         correction_failed = False
 
@@ -117,11 +125,10 @@ class AudioProcessor:
                 correction_failed = True
                 # Continue with raw text
 
-        # Step 3: Save to storage
-        if progress_callback:
-            progress_callback("Saving...")
-
-        self.storage.save(
+        # Step 3: Save to storage in the background so disk I/O
+        # doesn't delay insertion
+        save_future = self._io_pool.submit(
+            self.storage.save,
             audio_path,
             transcription=raw_text,
             cleaned_transcription=cleaned_text,
@@ -139,6 +146,9 @@ class AudioProcessor:
             if not inserted:
                 logger.info("Text insertion failed, will copy to clipboard")
 
+        # Surface any storage error
+        save_future.result()
+
         logger.info(
             "Processing complete",
             extra={
@@ -3,10 +3,26 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+if TYPE_CHECKING:
+    import boto3
+
+# boto3/botocore are imported lazily (they take hundreds of ms to import and
+# this module is loaded at startup for DEFAULT_CORRECTION_PROMPT)
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to stdlib json (slower, but same wire format)
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -89,15 +105,99 @@ NEVER DO:
 Now clean the following dictated text:"""
 
 
+# Size of the bedrock-runtime connection pool
+BEDROCK_MAX_POOL_CONNECTIONS = 20
+
+# Cross-region inference profile prefixes (e.g. "us.anthropic.claude-...")
+INFERENCE_PROFILE_PREFIXES = ("us.", "eu.", "apac.", "us-gov.", "global.")
+
+# Transcripts with fewer words than this get a local fixup instead of an LLM call
+MIN_WORDS_FOR_LLM = 3
+
+# Number of recent corrections remembered per provider instance
+CORRECTION_CACHE_SIZE = 256
+
+# Corrections are only cached when sampling is close to deterministic
+CACHEABLE_MAX_TEMPERATURE = 0.3
+
+# Models that accept Bedrock latency-optimized inference (matched as substrings of model IDs)
+LATENCY_OPTIMIZED_MODELS = ("claude-3-5-haiku",)
+
+
+@lru_cache(maxsize=None)
+def _get_client_config():
+    """Get the botocore config for Bedrock clients.
+
+    Keeps TLS connections alive between corrections and retries throttling
+    adaptively.
+
+    Returns:
+        Shared botocore Config
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+        read_timeout=120,
+        connect_timeout=10,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_session(aws_profile: Optional[str]) -> "boto3.Session":
+    """Get a shared boto3 session for an AWS profile.
+
+    Session creation resolves credentials, so it is done once per profile
+    and reused across provider instances (e.g. when settings are re-saved).
+
+    Args:
+        aws_profile: AWS profile name (None = default credential chain)
+
+    Returns:
+        Cached boto3 session
+    """
+    import boto3
+
+    if aws_profile:
+        logger.info(f"Initializing Bedrock with AWS profile: {aws_profile}")
+        return boto3.Session(profile_name=aws_profile)
+
+    logger.info("Initializing Bedrock with default AWS credentials")
+    return boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _get_bedrock_client(aws_profile: Optional[str], region: str):
+    """Get a shared bedrock-runtime client for a profile and region.
+
+    Args:
+        aws_profile: AWS profile name (None = default credential chain)
+        region: AWS region for Bedrock
+
+    Returns:
+        Cached bedrock-runtime client with connection pooling
+    """
+    session = _get_session(aws_profile)
+    return session.client(
+        "bedrock-runtime", region_name=region, config=_get_client_config()
+    )
+
+
 class LLMCorrector(ABC):
     """Abstract base class for LLM-based transcript correction."""
 
     @abstractmethod
-    def correct(self, text: str) -> str:
+    def correct(self, text: str, use_cache: bool = True, local_fixup: bool = True) -> str:
         """Correct the transcribed text using LLM.
 
         Args:
             text: Raw transcription to correct
+            use_cache: Whether a remembered result for the same text may be
+                returned (pass False for explicit re-runs)
+            local_fixup: Whether very short transcripts may be fixed up
+                without the LLM (pass False for explicit re-runs)
 
         Returns:
             Corrected text
@@ -127,6 +227,8 @@ class BedrockLLMProvider(LLMCorrector):
         aws_profile: Optional[str] = None,
         region: str = "us-east-1",
         custom_vocabulary: Optional[list[str]] = None,
+        latency_mode: str = "optimized",
+        min_words_for_llm: int = MIN_WORDS_FOR_LLM,
     ):
         """Initialize Bedrock LLM provider.
 
@@ -136,27 +238,48 @@ class BedrockLLMProvider(LLMCorrector):
             aws_profile: AWS profile name (None = default credential chain)
             region: AWS region for Bedrock
             custom_vocabulary: Optional list of words for spelling correction
+            latency_mode: "optimized" to request latency-optimized inference when the
+                model supports it, "standard" otherwise
+            min_words_for_llm: Transcripts with fewer words are fixed up locally
+                without calling Bedrock (0 = always call Bedrock)
         """
         self.model_id = model_id
         self.correction_prompt = correction_prompt
         self.custom_vocabulary = custom_vocabulary or []
         self.region = region
-
-        # Initialize boto3 session with optional profile
-        if aws_profile and aws_profile.strip():
-            logger.info(f"Initializing Bedrock with AWS profile: {aws_profile}")
-            session = boto3.Session(profile_name=aws_profile)
+        self.latency_mode = self._resolve_latency_mode(model_id, latency_mode)
+        # performanceConfigLatency only exists in newer botocore releases, so it
+        # is sent only when asking for something other than the default
+        self._invoke_options = (
+            {"performanceConfigLatency": "optimized"} if self.latency_mode == "optimized" else {}
+        )
+        self.min_words_for_llm = min_words_for_llm
+
+        # Prompt and vocabulary are fixed per instance, so build the static body once
+        self._base_body = self._build_base_body()
+        # Serialized once: the multi-KB prompt is never JSON-escaped/encoded per call
+        self._body_prefix = _json_dumps(self._base_body)[:-1] + b', "messages": [{"role": "user", "content": '
+
+        # Cache is per instance, so a new model, prompt or vocabulary starts empty
+        if self._base_body["temperature"] <= CACHEABLE_MAX_TEMPERATURE:
+            self._correct_cached = lru_cache(maxsize=CORRECTION_CACHE_SIZE)(self._invoke_correction)
         else:
-            logger.info("Initializing Bedrock with default AWS credentials")
-            session = boto3.Session()
+            self._correct_cached = self._invoke_correction
 
-        self.client = session.client("bedrock-runtime", region_name=region)
+        # Reuse boto3 session/client (and their pooled connections) with optional profile
+        profile = aws_profile.strip() if aws_profile and aws_profile.strip() else None
+        self._session = _get_session(profile)
+        self.client = _get_bedrock_client(profile, region)
 
-    def correct(self, text: str) -> str:
+    def correct(self, text: str, use_cache: bool = True, local_fixup: bool = True) -> str:
         """Correct transcription using Bedrock.
 
         Args:
             text: Raw transcription
+            use_cache: Whether a cached result for the same text may be
+                returned; False always calls Bedrock
+            local_fixup: Whether transcripts under min_words_for_llm words
+                are fixed up locally instead of sent to Bedrock
 
         Returns:
             Corrected text
@@ -169,6 +292,49 @@ class BedrockLLMProvider(LLMCorrector):
             logger.warning("Empty text provided for correction")
             return text
 
+        # Short utterances ("yes", "sounds good") rarely need more than
+        # capitalization and a full stop, so skip the round-trip
+        stripped = text.strip()
+        if local_fixup and len(stripped.split(None, self.min_words_for_llm)) < self.min_words_for_llm:
+            logger.info(f"Skipping LLM for short transcript ({len(stripped)} chars)")
+            return self._local_fixup(stripped)
+
+        if not use_cache:
+            return self._invoke_correction(text)
+
+        return self._correct_cached(text)
+
+    @staticmethod
+    def _local_fixup(text: str) -> str:
+        """Apply minimal formatting to a short transcript.
+
+        Args:
+            text: Non-empty, stripped transcript
+
+        Returns:
+            Text with the first letter capitalized and a full stop, unless the
+            first word already has mixed case ("iPhone") or the text ends in
+            punctuation
+        """
+        if text.split(None, 1)[0].islower():
+            text = text[0].upper() + text[1:]
+        if text[-1].isalnum():
+            text += "."
+        return text
+
+    def _invoke_correction(self, text: str) -> str:
+        """Send text to Bedrock for correction (uncached).
+
+        Args:
+            text: Raw transcription
+
+        Returns:
+            Corrected text
+
+        Raises:
+            ClientError: If Bedrock API call fails
+            ValueError: If response format is invalid
+        """
         logger.info(f"Correcting transcript with model: {self.model_id}")
 
         # Build the request based on model type
@@ -177,13 +343,16 @@ class BedrockLLMProvider(LLMCorrector):
         else:
             raise ValueError(f"Unsupported model: {self.model_id}")
 
+        from botocore.exceptions import ClientError
+
         try:
             response = self.client.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(body),
+                body=body,
+                **self._invoke_options,
             )
 
-            response_body = json.loads(response["body"].read())
+            response_body = _json_loads(response["body"].read())
             corrected_text = self._extract_response_text(response_body)
 
             logger.info(f"Correction successful. Input: {len(text)} chars, Output: {len(corrected_text)} chars")
@@ -196,24 +365,20 @@ class BedrockLLMProvider(LLMCorrector):
             raise
 
     def validate_credentials(self) -> tuple[bool, str]:
-        """Test AWS credentials and Bedrock access.
+        """Test AWS credentials and that the model is listed in the region.
+
+        Only free calls are made, so invoke access (model access grants,
+        bedrock:InvokeModel) is not tested; the messages say so.
 
         Returns:
             (True, "Success message") if valid, (False, "Error message") otherwise
         """
-        try:
-            # Try a minimal API call to validate access
-            test_text = "Hello world"
-            body = self._build_anthropic_request(test_text)
+        from botocore.exceptions import ClientError, NoCredentialsError
 
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(body),
-            )
-
-            # If we got here, credentials work
-            logger.info("Bedrock credentials validated successfully")
-            return True, f"Successfully connected to Bedrock with model {self.model_id}"
+        # Step 1: credentials (free, no Bedrock involved)
+        try:
+            identity = self._session.client("sts", region_name=self.region).get_caller_identity()
+            logger.info(f"AWS credentials valid for: {identity.get('Arn', 'unknown')}")
 
         except NoCredentialsError:
             msg = "No AWS credentials found. Configure AWS credentials or profile."
@@ -223,14 +388,45 @@ class BedrockLLMProvider(LLMCorrector):
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_msg = e.response.get("Error", {}).get("Message", str(e))
+            msg = f"AWS credentials rejected [{error_code}]: {error_msg}"
+            logger.error(msg)
+            return False, msg
 
-            if error_code == "AccessDeniedException":
-                msg = "Access denied. Check IAM permissions for Bedrock."
-            elif error_code == "ResourceNotFoundException":
-                msg = f"Model not found: {self.model_id}. Check model ID and region."
-            else:
-                msg = f"Bedrock error [{error_code}]: {error_msg}"
+        except Exception as e:
+            msg = f"Unexpected error: {str(e)}"
+            logger.error(msg)
+            return False, msg
+
+        # ARNs (application inference profiles, provisioned throughput) don't
+        # appear in the foundation model list, so they can't be checked here
+        if self.model_id.startswith("arn:"):
+            msg = (
+                f"AWS credentials are valid. Model {self.model_id} is not a foundation "
+                "model ID, so it could not be verified; invoke access was not tested."
+            )
+            logger.warning(msg)
+            return True, msg
+
+        # Step 2: Bedrock access and model availability (free control-plane call)
+        try:
+            bedrock = self._session.client("bedrock", region_name=self.region)
+            response = bedrock.list_foundation_models(byProvider="Anthropic")
+            available = {model["modelId"] for model in response.get("modelSummaries", [])}
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_msg = e.response.get("Error", {}).get("Message", str(e))
 
+            if error_code == "AccessDeniedException":
+                # Listing needs its own IAM permission; invoke access may still be fine
+                msg = (
+                    "AWS credentials are valid, but listing Bedrock models is not permitted, "
+                    f"so model {self.model_id} could not be verified; invoke access was not tested."
+                )
+                logger.warning(msg)
+                return True, msg
+
+            msg = f"Bedrock error [{error_code}]: {error_msg}"
             logger.error(msg)
             return False, msg
 
@@ -239,38 +435,90 @@ class BedrockLLMProvider(LLMCorrector):
             logger.error(msg)
             return False, msg
 
-    def _build_anthropic_request(self, text: str) -> dict:
-        """Build request body for Anthropic Claude models.
+        if self._base_model_id() not in available:
+            msg = f"Model not found: {self.model_id}. Check model ID and region."
+            logger.error(msg)
+            return False, msg
+
+        logger.info("Bedrock credentials and model listing validated")
+        return True, (
+            f"AWS credentials are valid and model {self.model_id} is listed in {self.region}. "
+            "Invoke access (model access grants, bedrock:InvokeModel) was not tested."
+        )
+
+    def _base_model_id(self) -> str:
+        """Get the foundation model ID, without any inference profile prefix.
+
+        Returns:
+            Model ID as listed by ListFoundationModels
+        """
+        for prefix in INFERENCE_PROFILE_PREFIXES:
+            if self.model_id.startswith(prefix):
+                return self.model_id[len(prefix):]
+        return self.model_id
+
+    @staticmethod
+    def _resolve_latency_mode(model_id: str, latency_mode: str) -> str:
+        """Pick the Bedrock latency mode to use for a model.
 
         Args:
-            text: Text to correct
+            model_id: Bedrock model identifier
+            latency_mode: Requested mode ("optimized" or "standard")
+
+        Returns:
+            "optimized" if requested and supported by the model, else "standard"
+        """
+        if latency_mode != "optimized":
+            return "standard"
+
+        if any(name in model_id for name in LATENCY_OPTIMIZED_MODELS):
+            logger.info(f"Using latency-optimized inference for model: {model_id}")
+            return "optimized"
+
+        return "standard"
+
+    def _build_base_body(self) -> dict:
+        """Build the static part of the Anthropic request body.
 
         Returns:
-            Request body dict for Bedrock API
+            Request body dict without messages
         """
-        # Build user prompt with optional vocabulary
-        user_content = self.correction_prompt
+        # Static instructions go in the system block so Bedrock can cache the prefix
+        system_prompt = self.correction_prompt
 
         # Add vocabulary hint if available (SuperWhisper style)
         if self.custom_vocabulary:
             vocab_str = ", ".join(self.custom_vocabulary)
             vocab_hint = f"\n\n<vocabulary>\nUse these words for spelling correction (only fix obvious misspellings): {vocab_str}\n</vocabulary>"
-            user_content += vocab_hint
-
-        user_content += f"\n\n{text}"
+            system_prompt += vocab_hint
 
         return {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": 4096,
-            "messages": [
+            "system": [
                 {
-                    "role": "user",
-                    "content": user_content,
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
                 }
             ],
             "temperature": 0.3,  # Lower temperature for more consistent corrections
         }
 
+    def _build_anthropic_request(self, text: str) -> bytes:
+        """Build request body for Anthropic Claude models.
+
+        Only the user text is serialized here; the static part of the body
+        is spliced in from the pre-encoded prefix.
+
+        Args:
+            text: Text to correct
+
+        Returns:
+            JSON-encoded request body for Bedrock API
+        """
+        return self._body_prefix + _json_dumps(text) + b"}]}"
+
     def _extract_response_text(self, response_body: dict) -> str:
         """Extract corrected text from Bedrock response.
 
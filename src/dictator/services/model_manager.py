@@ -3,12 +3,16 @@
 Handles model detection, downloading, and status tracking.
 """
 
+import atexit
 import logging
 import os
+import shutil
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from threading import Thread
 from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,17 @@ class ModelInfo:
             return f"{self.name} ({size_gb:.1f}GB)"
 
 
+# Model files smaller than this are treated as incomplete or corrupted
+MIN_MODEL_SIZE_BYTES = 1024 * 1024
+
+# Same source pywhispercpp downloads from
+MODELS_BASE_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main"
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT_SECONDS = 30
+DOWNLOAD_POOL_SIZE = 4
+DOWNLOAD_RETRIES = 3
+
+
 # Model catalog with sizes and characteristics
 WHISPER_MODELS = {
     "tiny.en": ModelInfo(
@@ -98,20 +113,78 @@ WHISPER_MODELS = {
 }
 
 
+# Quantized GGML variants published for each model (ggerganov/whisper.cpp on
+# HuggingFace), with their file sizes in MB
+QUANTIZED_VARIANTS = {
+    "tiny.en": {"q5_1": 31, "q8_0": 42},
+    "tiny": {"q5_1": 31, "q8_0": 42},
+    "base.en": {"q5_1": 57, "q8_0": 78},
+    "base": {"q5_1": 57, "q8_0": 78},
+    "small.en": {"q5_1": 181, "q8_0": 252},
+    "small": {"q5_1": 181, "q8_0": 252},
+    "medium.en": {"q5_0": 514, "q8_0": 785},
+    "medium": {"q5_0": 514, "q8_0": 785},
+    "large-v3-turbo": {"q5_0": 547, "q8_0": 834},
+    "large-v3": {"q5_0": 1030},
+}
+
+# Default weight quantization ("" = full precision)
+DEFAULT_QUANTIZATION = "q5_0"
+
+
+@lru_cache(maxsize=None)
+def _get_http_session():
+    """Get a shared keep-alive HTTP session for model downloads.
+
+    Connections are pooled so consecutive downloads skip the TLS handshake,
+    and transient failures are retried with backoff.
+
+    Returns:
+        requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=DOWNLOAD_POOL_SIZE,
+            pool_maxsize=DOWNLOAD_POOL_SIZE,
+            max_retries=Retry(
+                total=DOWNLOAD_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        ),
+    )
+    atexit.register(session.close)
+    return session
+
+
 class WhisperModelManager:
     """Manages Whisper model downloads and caching."""
 
     def __init__(self):
         """Initialize model manager."""
         self.cache_dir = self._get_cache_dir()
+        # Bounded pool so repeated download requests don't spawn a thread each
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisper-dl")
+        # One download at a time, so two callers never write the same .part file
+        self._download_lock = threading.Lock()
 
     def _get_cache_dir(self) -> Path:
         """Get whisper model cache directory.
 
-        pywhispercpp stores models in ~/.cache/whisper/
+        Uses pywhispercpp's own models directory
+        (~/Library/Application Support/pywhispercpp/models/ on macOS), so
+        models it downloaded before are found and not fetched again.
         """
-        home = Path.home()
-        cache_dir = home / ".cache" / "whisper"
+        from pywhispercpp.constants import MODELS_DIR
+
+        cache_dir = Path(MODELS_DIR)
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
@@ -131,24 +204,93 @@ class WhisperModelManager:
         Returns:
             True if model file exists in cache
         """
-        model_path = self._get_model_path(model_name)
-        exists = model_path.exists()
-
-        if exists:
-            # Verify file size is reasonable (at least 1MB)
-            size_mb = model_path.stat().st_size / (1024 * 1024)
-            if size_mb < 1:
-                logger.warning(
-                    "Model file too small, may be corrupted",
-                    extra={"model": model_name, "size_mb": size_mb},
-                )
-                return False
+        try:
+            size_bytes = self._get_model_path(model_name).stat().st_size
+        except FileNotFoundError:
+            size_bytes = None
 
+        downloaded = self._is_valid_model_size(model_name, size_bytes)
         logger.debug(
             "Model download check",
-            extra={"model": model_name, "downloaded": exists},
+            extra={"model": model_name, "downloaded": downloaded},
+        )
+        return downloaded
+
+    def _is_valid_model_size(self, model_name: str, size_bytes: Optional[int]) -> bool:
+        """Check that a model file exists and is large enough to be usable.
+
+        Args:
+            model_name: Name of the model
+            size_bytes: File size, or None if the file doesn't exist
+
+        Returns:
+            True if the file exists and is at least MIN_MODEL_SIZE_BYTES
+        """
+        if size_bytes is None:
+            return False
+
+        if size_bytes < MIN_MODEL_SIZE_BYTES:
+            logger.warning(
+                "Model file too small, may be corrupted",
+                extra={"model": model_name, "size_mb": size_bytes / (1024 * 1024)},
+            )
+            return False
+
+        return True
+
+    def _scan(self) -> dict[str, int]:
+        """Read the cache directory once and collect model file sizes.
+
+        Returns:
+            Mapping of file name to size in bytes for regular files
+        """
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return {
+                    entry.name: entry.stat().st_size
+                    for entry in entries
+                    if entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+
+    def resolve_model_name(self, model_name: str, quantization: str = "") -> str:
+        """Get the model name to load for a requested quantization.
+
+        Falls back to the full-precision model when no matching quantized
+        variant is published.
+
+        Args:
+            model_name: Name of the model (e.g., "large-v3-turbo")
+            quantization: Quantization suffix (e.g., "q5_0"), or "" for full precision
+
+        Returns:
+            Model name as understood by pywhispercpp (e.g., "large-v3-turbo-q5_0")
+        """
+        if quantization and quantization in QUANTIZED_VARIANTS.get(model_name, ()):
+            return f"{model_name}-{quantization}"
+        return model_name
+
+    def resolve_model_info(self, model_name: str, quantization: str = "") -> Optional[ModelInfo]:
+        """Get information about the model file loaded for a quantization.
+
+        Args:
+            model_name: Name of the model (e.g., "large-v3-turbo")
+            quantization: Quantization suffix (e.g., "q5_0"), or "" for full precision
+
+        Returns:
+            ModelInfo named and sized for the resolved file (e.g.,
+            "large-v3-turbo-q5_0"), or None if the model is not in the catalog
+        """
+        model_info = self.get_model_info(model_name)
+        resolved_name = self.resolve_model_name(model_name, quantization)
+        if model_info is None or resolved_name == model_name:
+            return model_info
+        return replace(
+            model_info,
+            name=resolved_name,
+            size_mb=QUANTIZED_VARIANTS[model_name][quantization],
         )
-        return exists
 
     def get_model_info(self, model_name: str) -> Optional[ModelInfo]:
         """Get information about a model.
@@ -169,34 +311,113 @@ class WhisperModelManager:
         """
         return sorted(WHISPER_MODELS.values(), key=lambda m: m.size_mb)
 
+    def download(
+        self,
+        model_name: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> Path:
+        """Download a model file into the cache, resuming a partial download.
+
+        Returns immediately if the model is already downloaded.
+
+        Args:
+            model_name: Name of the model (e.g., "large-v3-turbo-q5_0")
+            progress_callback: Called with the percentage done, at most once
+                per percentage point
+
+        Returns:
+            Path to the downloaded model file
+
+        Raises:
+            requests.RequestException: If the download fails
+        """
+        model_path = self._get_model_path(model_name)
+
+        with self._download_lock:
+            if self.is_model_downloaded(model_name):
+                return model_path
+
+            part_path = model_path.with_name(model_path.name + ".part")
+            try:
+                offset = part_path.stat().st_size
+            except FileNotFoundError:
+                offset = 0
+
+            logger.info("Starting model download", extra={"model": model_name, "resume_from": offset})
+
+            url = f"{MODELS_BASE_URL}/{model_path.name}"
+            response = self._request_download(url, offset)
+            if offset and response.status_code == 416:
+                # .part is stale or already complete - start over
+                response.close()
+                logger.warning("Discarding unresumable partial download", extra={"model": model_name})
+                part_path.unlink(missing_ok=True)
+                offset = 0
+                response = self._request_download(url, offset)
+
+            with response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    offset = 0  # Range ignored - server sent the whole file
+
+                total = offset + int(response.headers.get("Content-Length", 0))
+                downloaded = offset
+                last_percent = -1
+
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback and total:
+                            percent = downloaded * 100 // total
+                            if percent != last_percent:
+                                last_percent = percent
+                                progress_callback(percent)
+
+            os.replace(part_path, model_path)
+
+        logger.info("Model download complete", extra={"model": model_name, "size_bytes": downloaded})
+        return model_path
+
+    def _request_download(self, url: str, offset: int):
+        """Start a streaming GET for a model file.
+
+        Args:
+            url: Model file URL
+            offset: Byte offset to resume from (0 for the whole file)
+
+        Returns:
+            Streaming requests.Response (caller closes it)
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        return _get_http_session().get(
+            url,
+            headers=headers,
+            stream=True,
+            timeout=DOWNLOAD_TIMEOUT_SECONDS,
+        )
+
     def download_model_async(
         self,
         model_name: str,
         completion_callback: Optional[Callable[[bool, str], None]] = None,
-    ) -> Thread:
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> Future:
         """Download a model asynchronously.
 
         Args:
             model_name: Name of the model to download
             completion_callback: Called with (success, message) when done
+            progress_callback: Called with the percentage done (see download)
 
         Returns:
-            Thread object (already started)
+            Future for the download (already queued on the download pool)
         """
 
         def download_worker():
             """Worker function for download thread."""
             try:
-                logger.info("Starting model download", extra={"model": model_name})
-
-                # Import here to avoid circular dependency
-                from pywhispercpp.model import Model
-
-                # Download model (this blocks until complete)
-                # pywhispercpp doesn't provide granular progress, so we just wait
-                _ = Model(model_name, n_threads=1, print_progress=False)
-
-                logger.info("Model download complete", extra={"model": model_name})
+                self.download(model_name, progress_callback)
 
                 if completion_callback:
                     completion_callback(True, f"Model {model_name} downloaded successfully")
@@ -208,19 +429,23 @@ class WhisperModelManager:
                 if completion_callback:
                     completion_callback(False, error_msg)
 
-        thread = Thread(target=download_worker, daemon=True)
-        thread.start()
-        return thread
+        return self._pool.submit(download_worker)
 
-    def get_downloaded_models(self) -> list[str]:
+    def get_downloaded_models(self, quantization: str = "") -> list[str]:
         """Get list of all downloaded model names.
 
+        Args:
+            quantization: Quantization the models would be loaded with; a
+                model counts as downloaded if its resolved file is present
+
         Returns:
-            List of model names that are downloaded
+            List of catalog model names that are downloaded
         """
+        files = self._scan()
         downloaded = []
-        for model_name in WHISPER_MODELS.keys():
-            if self.is_model_downloaded(model_name):
+        for model_name in WHISPER_MODELS:
+            resolved_name = self.resolve_model_name(model_name, quantization)
+            if self._is_valid_model_size(resolved_name, files.get(self._get_model_path(resolved_name).name)):
                 downloaded.append(model_name)
         return downloaded
 
@@ -245,6 +470,16 @@ class WhisperModelManager:
         Returns:
             Available space in MB
         """
-        stat = os.statvfs(self.cache_dir)
-        available_mb = (stat.f_bavail * stat.f_frsize) / (1024 * 1024)
-        return int(available_mb)
+        return shutil.disk_usage(self.cache_dir).free >> 20
+
+
+@lru_cache(maxsize=None)
+def get_manager() -> WhisperModelManager:
+    """Get the process-wide model manager.
+
+    The cache directory is resolved (and created) once, on first use.
+
+    Returns:
+        Shared WhisperModelManager instance
+    """
+    return WhisperModelManager()
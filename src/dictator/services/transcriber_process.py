@@ -0,0 +1,228 @@
+"""Whisper model hosted in a separate process.
+
+Runs pywhispercpp in a spawned child so a crash in the C++ library kills
+the worker instead of the app. Audio is handed over through shared memory.
+"""
+
+import logging
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn, model_name: str, n_threads: int) -> None:
+    """Child process entry point: load the model and serve requests.
+
+    Protocol (tuples over the pipe):
+        parent -> child: ("transcribe", media, initial_prompt, want_segments)
+            where media is ("shm", name, n_samples) or ("path", path)
+        parent -> child: ("stop",)
+        child -> parent: ("ready",) once, then per request zero or more
+            ("segment", text) followed by ("done", text) or ("error", message)
+
+    Args:
+        conn: Child end of the multiprocessing pipe
+        model_name: pywhispercpp model name or path to a ggml model file
+        n_threads: whisper.cpp thread count
+    """
+    from operator import attrgetter
+
+    from pywhispercpp.model import Model
+
+    try:
+        model = Model(model_name, n_threads=n_threads)
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+
+    conn.send(("ready",))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return  # Parent went away
+
+        if message[0] == "stop":
+            return
+
+        _, media, initial_prompt, want_segments = message
+        shm = None
+        try:
+            if media[0] == "shm":
+                _, shm_name, n_samples = media
+                # The parent owns the block and unlinks it after the reply
+                shm = shared_memory.SharedMemory(name=shm_name)
+                audio = np.ndarray((n_samples,), dtype=np.float32, buffer=shm.buf)
+            else:
+                audio = media[1]
+
+            params = {"initial_prompt": initial_prompt}
+            if want_segments:
+                params["new_segment_callback"] = lambda segment: conn.send(("segment", segment.text))
+
+            segments = model.transcribe(audio, **params)
+            conn.send(("done", "".join(map(attrgetter("text"), segments)).strip()))
+
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+        finally:
+            audio = None  # Release the view before closing the mapping
+            if shm is not None:
+                shm.close()
+
+
+class TranscriberProcess:
+    """A warm Whisper model in a child process.
+
+    If the child dies, the next start() spawns a fresh one.
+    """
+
+    def __init__(self, model_name: str, n_threads: int):
+        """Initialize (does not start the process).
+
+        Args:
+            model_name: pywhispercpp model name or path to a ggml model file
+            n_threads: whisper.cpp thread count
+        """
+        self.model_name = model_name
+        self.n_threads = n_threads
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()  # One request in flight at a time
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if the worker process is running.
+
+        Returns:
+            True if the child is alive
+        """
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Spawn the worker and wait until its model is loaded.
+
+        Raises:
+            RuntimeError: If the worker fails to load the model
+        """
+        with self._lock:
+            if self.is_alive:
+                return
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        """Spawn the worker (caller holds self._lock)."""
+        # spawn: a fork of a process with Qt/AppKit threads is unsafe on macOS
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.model_name, self.n_threads),
+            name="whisper-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            message = parent_conn.recv()
+        except EOFError:
+            message = ("error", f"worker exited with code {process.exitcode}")
+
+        if message[0] != "ready":
+            parent_conn.close()
+            process.join(timeout=1)
+            raise RuntimeError(f"Failed to start Whisper worker: {message[1]}")
+
+        self._process = process
+        self._conn = parent_conn
+        logger.info(
+            "Whisper worker started",
+            extra={"model": self.model_name, "pid": process.pid},
+        )
+
+    def transcribe(
+        self,
+        media: Union[np.ndarray, str],
+        initial_prompt: str,
+        segment_callback: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Transcribe audio in the worker process.
+
+        Args:
+            media: float32 16kHz mono samples, or path to an audio file
+            initial_prompt: Whisper initial prompt
+            segment_callback: Optional callback receiving each segment's text
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            RuntimeError: If transcription fails or the worker crashed
+        """
+        with self._lock:
+            if not self.is_alive:
+                self._start_locked()
+
+            shm = None
+            try:
+                if isinstance(media, np.ndarray):
+                    samples = np.ascontiguousarray(media, dtype=np.float32)
+                    shm = shared_memory.SharedMemory(create=True, size=max(samples.nbytes, 1))
+                    np.ndarray(samples.shape, dtype=np.float32, buffer=shm.buf)[:] = samples
+                    media_ref = ("shm", shm.name, samples.size)
+                else:
+                    media_ref = ("path", str(media))
+
+                self._conn.send(("transcribe", media_ref, initial_prompt, segment_callback is not None))
+
+                while True:
+                    kind, payload = self._conn.recv()
+                    if kind == "segment":
+                        if segment_callback:
+                            segment_callback(payload)
+                    elif kind == "done":
+                        return payload
+                    else:
+                        raise RuntimeError(payload)
+
+            except (EOFError, OSError) as e:
+                # Worker died mid-request (e.g. segfault in whisper.cpp)
+                process = self._process
+                self._discard_locked()
+                exitcode = process.exitcode if process else None
+                raise RuntimeError(f"Whisper worker crashed (exit code {exitcode}): {e}")
+
+            finally:
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+
+    def stop(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            if self._conn is not None and self.is_alive:
+                try:
+                    self._conn.send(("stop",))
+                except OSError:
+                    pass
+            self._discard_locked()
+
+    def _discard_locked(self) -> None:
+        """Drop the pipe and reap the process (caller holds self._lock)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+        if self._process is not None:
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.kill()
+            self._process = None
@@ -4,20 +4,31 @@ Manages saving and loading recordings and metadata.
 """
 
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from operator import itemgetter
+import heapq
 import json
 import logging
+import os
+import threading
+import time
 
 from dictator.models import Recording
 
 logger = logging.getLogger(__name__)
 
+# Suffix convert_to_wav() gives files it writes into the recordings directory
+CONVERTED_SUFFIX = "_converted.wav"
+CONVERTED_RETENTION = timedelta(days=30)
+
 
 class RecordingStorage:
     """Handles persistence of recordings and metadata.
 
-    Stores metadata in JSON file and manages audio file organization.
+    Stores metadata in a JSON Lines file (one recording per line) and manages
+    audio file organization. New recordings are appended; updates rewrite the
+    file atomically.
     """
 
     def __init__(self, recordings_dir: Path):
@@ -27,13 +38,47 @@ class RecordingStorage:
             recordings_dir: Directory to store recordings and metadata
         """
         self.recordings_dir = Path(recordings_dir)
-        self.metadata_path = self.recordings_dir / "metadata.json"
+        self.metadata_path = self.recordings_dir / "metadata.jsonl"
+        self.legacy_metadata_path = self.recordings_dir / "metadata.json"
+
+        # Parsed recordings, reloaded only when the file's mtime changes
+        self._cache: Optional[List[Recording]] = None
+        self._cache_mtime_ns: Optional[int] = None
+        self._index: Dict[Path, int] = {}  # audio_path -> position in self._cache
+        # True while the file is in timestamp order (the normal append-only case)
+        self._chronological = True
+        self._lock = threading.Lock()
+
         self._ensure_directory()
+        self._migrate_legacy_metadata()
 
     def _ensure_directory(self) -> None:
         """Create recordings directory if it doesn't exist."""
         self.recordings_dir.mkdir(parents=True, exist_ok=True)
 
+    def _migrate_legacy_metadata(self) -> None:
+        """Convert metadata.json from older versions to metadata.jsonl.
+
+        The old file is kept as metadata.json.bak after a successful migration.
+        """
+        if self.metadata_path.exists() or not self.legacy_metadata_path.exists():
+            return
+
+        try:
+            with open(self.legacy_metadata_path, "r") as f:
+                data = json.load(f)
+            recordings = [Recording.from_dict(item) for item in data]
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Malformed legacy metadata file, not migrating: {e}")
+            return
+
+        self._save_metadata(recordings)
+        os.replace(
+            self.legacy_metadata_path,
+            self.legacy_metadata_path.with_name("metadata.json.bak"),
+        )
+        logger.info("Migrated recording metadata to JSON Lines", extra={"count": len(recordings)})
+
     def save(
         self,
         audio_path: Path,
@@ -60,9 +105,14 @@ class RecordingStorage:
             cleaned_transcription=cleaned_transcription,
         )
 
-        recordings = self.load_all()
-        recordings.append(recording)
-        self._save_metadata(recordings)
+        with self._lock:
+            recordings = self._load_cached()
+            self._append_metadata(recording)
+            self._index.setdefault(recording.audio_path, len(recordings))
+            if recordings and recording.timestamp < recordings[-1].timestamp:
+                self._chronological = False  # Clock went backwards
+            recordings.append(recording)
+            self._cache_mtime_ns = self._metadata_mtime_ns()
 
         logger.info(
             "Saved recording",
@@ -82,16 +132,40 @@ class RecordingStorage:
         Returns:
             List of all stored recordings
         """
-        if not self.metadata_path.exists():
-            return []
+        with self._lock:
+            return list(self._load_cached())
 
-        try:
-            with open(self.metadata_path, "r") as f:
-                data = json.load(f)
-            return [Recording.from_dict(item) for item in data]
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Malformed metadata file, starting fresh: {e}")
-            return []
+    def load_recent(self, limit: int, before: Optional[Recording] = None) -> List[Recording]:
+        """Load the newest recordings, newest first.
+
+        Pages are keyed by the last recording already shown rather than by
+        an offset, so recordings saved in the meantime don't shift later
+        pages. Recordings are appended as they are made, so the file is
+        normally already in timestamp order and the page is sliced off the
+        file. Otherwise a partial sort picks the page.
+
+        Args:
+            limit: Maximum number of recordings to return
+            before: Last recording of the previous page; only older
+                recordings are returned (None for the first page)
+
+        Returns:
+            Up to `limit` recordings sorted by timestamp, newest first
+        """
+        with self._lock:
+            recordings = self._load_cached()
+            end = len(recordings) if before is None else self._index.get(before.audio_path)
+            if self._chronological and end is not None:
+                return recordings[max(end - limit, 0):end][::-1]
+
+            # Order by (timestamp, file position) so equal timestamps page consistently
+            keyed = ((rec.timestamp, i, rec) for i, rec in enumerate(recordings))
+            if before is not None:
+                # A cursor no longer in the file falls back to its timestamp
+                cursor = (before.timestamp, -1 if end is None else end)
+                keyed = (item for item in keyed if item[:2] < cursor)
+            newest = heapq.nlargest(limit, keyed, key=itemgetter(0, 1))
+        return [item[2] for item in newest]
 
     def update(self, recording: Recording) -> None:
         """Update an existing recording.
@@ -99,26 +173,132 @@ class RecordingStorage:
         Args:
             recording: Recording to update
         """
-        recordings = self.load_all()
+        with self._lock:
+            recordings = self._load_cached()
 
-        for i, rec in enumerate(recordings):
-            if rec.audio_path == recording.audio_path:
-                recordings[i] = recording
-                break
-        else:
-            raise ValueError(
-                f"Recording not found: {recording.audio_path}"
-            )
+            i = self._index.get(recording.audio_path)
+            if i is None:
+                raise ValueError(
+                    f"Recording not found: {recording.audio_path}"
+                )
+            recordings[i] = recording
+
+            self._save_metadata(recordings)
+            self._cache_mtime_ns = self._metadata_mtime_ns()
 
-        self._save_metadata(recordings)
         logger.info("Updated recording", extra={"audio_path": str(recording.audio_path)})
 
+    def prune_converted(self, older_than: timedelta = CONVERTED_RETENTION) -> int:
+        """Delete stale WAVs left behind by file conversion.
+
+        Only converted files that no recording points at are removed, so
+        history entries keep their audio.
+
+        Args:
+            older_than: Minimum age (by mtime) of files to delete
+
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - older_than.total_seconds()
+
+        with self._lock:
+            self._load_cached()  # Refreshes self._index
+            referenced = {str(path) for path in self._index}
+
+        removed = 0
+        with os.scandir(self.recordings_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(CONVERTED_SUFFIX) or entry.path in referenced:
+                    continue
+                try:
+                    if entry.stat().st_mtime >= cutoff:
+                        continue
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Failed to remove converted file {entry.name}: {e}")
+
+        if removed:
+            logger.info("Pruned converted audio files", extra={"count": removed})
+        return removed
+
+    def _metadata_mtime_ns(self) -> Optional[int]:
+        """Get the metadata file's modification time.
+
+        Returns:
+            mtime in nanoseconds, or None if the file doesn't exist
+        """
+        try:
+            return os.stat(self.metadata_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load_cached(self) -> List[Recording]:
+        """Get the cached recordings list, re-reading the file if it changed.
+
+        Must be called with self._lock held. The returned list is the cache
+        itself, so callers that mutate it must keep the file in sync.
+
+        Returns:
+            Cached list of recordings
+        """
+        mtime_ns = self._metadata_mtime_ns()
+        if self._cache is not None and mtime_ns == self._cache_mtime_ns:
+            return self._cache
+
+        self._cache = self._read_metadata() if mtime_ns is not None else []
+        self._cache_mtime_ns = mtime_ns
+        # First occurrence wins, matching the previous linear scan
+        self._index = {}
+        for i, rec in enumerate(self._cache):
+            self._index.setdefault(rec.audio_path, i)
+        self._chronological = all(
+            a.timestamp <= b.timestamp for a, b in zip(self._cache, self._cache[1:])
+        )
+        return self._cache
+
+    def _read_metadata(self) -> List[Recording]:
+        """Parse all recordings from the metadata file.
+
+        Returns:
+            List of recordings in file order
+        """
+        recordings = []
+        with open(self.metadata_path, "r") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    recordings.append(Recording.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError) as e:
+                    # Skip just this entry (e.g. a line truncated by a crash mid-append)
+                    logger.warning(f"Skipping malformed metadata line {line_number}: {e}")
+        return recordings
+
+    def _append_metadata(self, recording: Recording) -> None:
+        """Append a single recording to the metadata file.
+
+        Args:
+            recording: Recording to append
+        """
+        line = json.dumps(recording.to_dict()) + "\n"
+        with open(self.metadata_path, "ab+") as f:
+            # Start on a fresh line if a crash left a partial last line, so
+            # this entry isn't glued onto it and skipped as malformed too
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+
     def _save_metadata(self, recordings: List[Recording]) -> None:
-        """Save metadata to JSON file.
+        """Rewrite the whole metadata file atomically.
 
         Args:
             recordings: List of recordings to save
         """
-        data = [rec.to_dict() for rec in recordings]
-        with open(self.metadata_path, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = self.metadata_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(rec.to_dict()) + "\n" for rec in recordings)
+        os.replace(tmp_path, self.metadata_path)
@@ -3,15 +3,66 @@
 Uses whisper.cpp for fast, local transcription.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, Callable
 import logging
+import os
+import subprocess
 import time
 import threading
-from pywhispercpp.model import Model
+
+from dictator.services.audio_converter import load_pcm_array
 
 logger = logging.getLogger(__name__)
 
+# whisper.cpp matmul stops scaling past the physical (performance) cores
+MAX_AUTO_THREADS = 16
+
+# Retry backoff after a native failure: 50 ms, doubling, capped at 500 ms
+RETRY_BACKOFF_BASE = 0.05
+RETRY_BACKOFF_MAX = 0.5
+
+
+def _sysctl_int(name: str) -> Optional[int]:
+    """Read an integer sysctl value (macOS).
+
+    Args:
+        name: sysctl key, e.g. "hw.physicalcpu"
+
+    Returns:
+        Value, or None if unavailable
+    """
+    try:
+        result = subprocess.run(
+            ["sysctl", "-n", name], capture_output=True, text=True, timeout=1
+        )
+        return int(result.stdout.strip()) if result.returncode == 0 else None
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def detect_thread_count(policy: str = "perf-only") -> int:
+    """Pick a whisper.cpp thread count for this machine.
+
+    Args:
+        policy: "perf-only" (Apple Silicon performance cores, else physical
+            cores), "physical" (physical cores), or "all" (logical CPUs)
+
+    Returns:
+        Thread count clamped to [1, MAX_AUTO_THREADS]
+    """
+    count = None
+    if policy == "perf-only":
+        count = _sysctl_int("hw.perflevel0.physicalcpu")
+    if count is None and policy in ("perf-only", "physical"):
+        count = _sysctl_int("hw.physicalcpu")
+    if count is None:
+        count = os.cpu_count() or 1
+
+    return max(1, min(count, MAX_AUTO_THREADS))
+
 
 class WhisperTranscriber:
     """Transcribes audio using Whisper model.
@@ -22,24 +73,51 @@ class WhisperTranscriber:
     def __init__(
         self,
         model_name: str = "large-v3-turbo",
-        n_threads: int = 8,
+        n_threads: Optional[int] = None,
+        quantization: str = "q5_0",
         custom_vocabulary: Optional[list[str]] = None,
         download_progress_callback: Optional[Callable[[str], None]] = None,
+        preload: bool = True,
+        thread_policy: str = "perf-only",
+        isolate_process: bool = False,
     ):
         """Initialize transcriber.
 
         Args:
             model_name: Whisper model to use
-            n_threads: Number of CPU threads for transcription
+            n_threads: Number of CPU threads for transcription (None or 0 = auto-detect)
+            quantization: GGML weight quantization (e.g., "q5_0", "q8_0"); "" loads
+                full precision. Models without that variant load full precision.
             custom_vocabulary: Optional list of custom words for better recognition
             download_progress_callback: Optional callback for download progress messages
+            preload: Start loading the model on a background thread right away so
+                the first transcription doesn't pay model-init time. Poll
+                `is_ready` to know when it's warm.
+            thread_policy: Core selection used when auto-detecting threads (see
+                detect_thread_count)
+            isolate_process: Run the model in a child process so a whisper.cpp
+                crash kills the worker (which is respawned) instead of the app
         """
         self.model_name = model_name
-        self.n_threads = n_threads
+        self.configured_threads = n_threads or 0  # As configured (0 = auto)
+        self.n_threads = n_threads or detect_thread_count(thread_policy)
+        self.quantization = quantization
+        self.isolate_process = isolate_process
         self.custom_vocabulary = custom_vocabulary or []
+        self._initial_prompt = self._build_initial_prompt()
         self.download_progress_callback = download_progress_callback
         self._model = None
         self._model_lock = threading.RLock()  # Reentrant lock for model loading thread safety
+        # Single worker: whisper.cpp already uses n_threads internally, and one
+        # model context must not run two transcriptions at once
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper-transcribe"
+        )
+
+        if preload:
+            # load_model() holds the model lock, so a transcribe() arriving
+            # mid-load waits for this instead of loading a second copy
+            threading.Thread(target=self.load_model, name="whisper-preload", daemon=True).start()
 
     def load_model(self) -> None:
         """Load the Whisper model into memory (thread-safe).
@@ -64,18 +142,21 @@ class WhisperTranscriber:
             )
 
             # Check if model needs downloading
-            from dictator.services.model_manager import WhisperModelManager
+            from dictator.services.model_manager import get_manager
 
-            model_manager = WhisperModelManager()
-            if not model_manager.is_model_downloaded(self.model_name):
-                msg = f"Downloading model {self.model_name}..."
-                logger.info(f"[{thread_name}] {msg}")
-                if self.download_progress_callback:
-                    self.download_progress_callback(msg)
+            model_manager = get_manager()
+            resolved_name = model_manager.resolve_model_name(self.model_name, self.quantization)
 
             try:
-                logger.info(f"[{thread_name}] Initializing pywhispercpp.Model (C++ library)")
-                self._model = Model(self.model_name, n_threads=self.n_threads)
+                logger.info(f"[{thread_name}] Initializing pywhispercpp.Model (C++ library): {resolved_name}")
+                try:
+                    self._model = self._create_model(self._fetch_model(model_manager, resolved_name))
+                except Exception as e:
+                    if resolved_name == self.model_name:
+                        raise
+                    # Quantized variant unavailable or broken - use full precision
+                    logger.warning(f"[{thread_name}] Failed to load {resolved_name}, falling back to {self.model_name}: {e}")
+                    self._model = self._create_model(self._fetch_model(model_manager, self.model_name))
                 logger.info(f"[{thread_name}] Model loaded successfully")
             except Exception as e:
                 logger.error(f"[{thread_name}] Failed to load model: {e}")
@@ -84,6 +165,51 @@ class WhisperTranscriber:
 
         logger.info(f"[{thread_name}] Model lock released")
 
+    def _fetch_model(self, model_manager, model_name: str) -> str:
+        """Get the local model file, downloading it with progress if needed.
+
+        Args:
+            model_manager: WhisperModelManager to download through
+            model_name: Model name (e.g., "large-v3-turbo-q5_0")
+
+        Returns:
+            Path to the ggml model file
+        """
+
+        def report(percent: int) -> None:
+            if self.download_progress_callback:
+                self.download_progress_callback(f"Downloading model {model_name}... {percent}%")
+
+        return str(model_manager.download(model_name, report))
+
+    def _create_model(self, model_name: str):
+        """Load a model in-process, or start a worker process hosting it.
+
+        Args:
+            model_name: pywhispercpp model name or path to a ggml model file
+
+        Returns:
+            pywhispercpp Model or started TranscriberProcess
+        """
+        if self.isolate_process:
+            from dictator.services.transcriber_process import TranscriberProcess
+
+            worker = TranscriberProcess(model_name, self.n_threads)
+            worker.start()
+            return worker
+
+        # Import here so the C extension doesn't load at app startup
+        from pywhispercpp.model import Model
+
+        return Model(model_name, n_threads=self.n_threads)
+
+    def _discard_model(self) -> None:
+        """Drop the current model, stopping its worker process if any."""
+        with self._model_lock:
+            model, self._model = self._model, None
+        if model is not None and self.isolate_process:
+            model.stop()
+
     def reload_model(self) -> None:
         """Force reload the Whisper model (thread-safe).
 
@@ -92,18 +218,23 @@ class WhisperTranscriber:
         thread_name = threading.current_thread().name
         logger.info(f"[{thread_name}] Force reloading Whisper model")
 
-        with self._model_lock:
-            logger.info(f"[{thread_name}] Model lock acquired for reload, clearing model")
-            self._model = None  # Clear existing model
+        logger.info(f"[{thread_name}] Clearing model for reload")
+        self._discard_model()
 
         # load_model() will acquire lock again (RLock allows same thread to re-acquire)
         self.load_model()
 
-    def transcribe(self, audio_path: Path) -> str:
+    def transcribe(
+        self,
+        audio_path: Path,
+        segment_callback: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Transcribe audio file to text with retry logic.
 
         Args:
             audio_path: Path to audio file
+            segment_callback: Optional callback receiving each segment's text as
+                whisper.cpp produces it (called from the transcription thread)
 
         Returns:
             Transcribed text
@@ -115,62 +246,118 @@ class WhisperTranscriber:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Build initial_prompt with vocabulary (SuperWhisper style)
-        initial_prompt = self._build_initial_prompt()
+        # initial_prompt with vocabulary (SuperWhisper style), built when vocabulary is set
+        initial_prompt = self._initial_prompt
+
+        # Hand whisper.cpp samples directly when the WAV is already in its
+        # format; otherwise pywhispercpp decodes the file via ffmpeg
+        media = load_pcm_array(audio_path)
+        if media is None:
+            media = str(audio_path)
 
         # Try transcription with retry logic for segfaults
         max_retries = 3
+        # Hot path: deferred %-formatting, and the extra dicts are only built
+        # when INFO is on
+        log_info = logger.isEnabledFor(logging.INFO)
         thread_name = threading.current_thread().name
 
         for attempt in range(max_retries):
             try:
                 # Check if model needs loading (thread-safe via load_model's lock)
                 if self._model is None:
-                    logger.info(f"[{thread_name}] Model not loaded, loading now (attempt {attempt + 1})")
+                    logger.info("[%s] Model not loaded, loading now (attempt %d)", thread_name, attempt + 1)
                     self.load_model()
 
-                logger.info(
-                    f"[{thread_name}] Starting transcription",
-                    extra={
-                        "model": self.model_name,
-                        "threads": self.n_threads,
-                        "audio_path": str(audio_path),
-                        "vocab_count": len(self.custom_vocabulary),
-                        "attempt": attempt + 1,
-                    },
-                )
-                logger.info(f"[{thread_name}] 🎙️  Using Whisper model: {self.model_name} ({self.n_threads} threads)")
+                if log_info:
+                    logger.info(
+                        "[%s] 🎙️  Starting transcription with Whisper model %s (%d threads)",
+                        thread_name,
+                        self.model_name,
+                        self.n_threads,
+                        extra={
+                            "model": self.model_name,
+                            "threads": self.n_threads,
+                            "audio_path": str(audio_path),
+                            "vocab_count": len(self.custom_vocabulary),
+                            "attempt": attempt + 1,
+                        },
+                    )
 
                 # Transcribe with initial_prompt (C++ library call - not thread-safe for loading)
-                logger.info(f"[{thread_name}] Calling C++ transcribe() method")
-                segments = self._model.transcribe(
-                    str(audio_path), initial_prompt=initial_prompt
-                )
-                text = "".join([seg.text for seg in segments]).strip()
-
-                logger.info(
-                    "Transcription complete",
-                    extra={"text_length": len(text), "char_count": len(text)},
-                )
+                if self.isolate_process:
+                    # Worker joins the segments itself
+                    text = self._model.transcribe(media, initial_prompt, segment_callback)
+                elif segment_callback:
+                    segments = self._model.transcribe(
+                        media,
+                        initial_prompt=initial_prompt,
+                        new_segment_callback=lambda segment: segment_callback(segment.text),
+                    )
+                    text = "".join(map(attrgetter("text"), segments)).strip()
+                else:
+                    segments = self._model.transcribe(
+                        media, initial_prompt=initial_prompt
+                    )
+                    text = "".join(map(attrgetter("text"), segments)).strip()
+
+                if log_info:
+                    text_length = len(text)
+                    logger.info(
+                        "[%s] Transcription complete",
+                        thread_name,
+                        extra={"text_length": text_length, "char_count": text_length},
+                    )
 
                 return text
 
+            except (FileNotFoundError, ValueError):
+                # Bad input, not a corrupted model - reloading won't help
+                raise
+
             except Exception as e:
-                logger.error(f"[{thread_name}] Transcription failed (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error("[%s] Transcription failed (attempt %d/%d): %s", thread_name, attempt + 1, max_retries, e)
 
                 # If segfault or model failure, try reloading
                 if attempt < max_retries - 1:
-                    logger.warning(f"[{thread_name}] Attempting to reload model and retry")
+                    logger.warning("[%s] Clearing potentially corrupted model and retrying", thread_name)
 
                     # Clear potentially corrupted model (thread-safe)
-                    with self._model_lock:
-                        logger.info(f"[{thread_name}] Clearing potentially corrupted model")
-                        self._model = None
+                    self._discard_model()
 
-                    time.sleep(1.0)  # Brief pause before retry
+                    time.sleep(min(RETRY_BACKOFF_BASE * (2 ** attempt), RETRY_BACKOFF_MAX))
                 else:
                     raise RuntimeError(f"Transcription failed after {max_retries} attempts: {e}")
 
+    def transcribe_async(
+        self,
+        audio_path: Path,
+        segment_callback: Optional[Callable[[str], None]] = None,
+    ) -> Future:
+        """Transcribe audio file on the transcriber's worker thread.
+
+        Calls are queued, so concurrent callers (hotkey recordings and file
+        uploads) never run the model at the same time.
+
+        Args:
+            audio_path: Path to audio file
+            segment_callback: Optional callback receiving each segment's text
+
+        Returns:
+            Future resolving to the transcribe() result
+        """
+        return self._executor.submit(self.transcribe, audio_path, segment_callback)
+
+    def set_vocabulary(self, words: list[str]) -> None:
+        """Replace the custom vocabulary without reloading the model.
+
+        Args:
+            words: Custom words, names, technical terms
+        """
+        self.custom_vocabulary = list(words)
+        self._initial_prompt = self._build_initial_prompt()
+        logger.info("Updated transcriber vocabulary", extra={"vocab_count": len(words)})
+
     def _build_initial_prompt(self) -> str:
         """Build initial prompt for Whisper.
 
@@ -5,9 +5,9 @@ the same pipeline as voice recordings.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import threading
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -24,6 +24,7 @@ import AppKit
 
 from dictator.services.audio_processor import AudioProcessor
 from dictator.services.audio_converter import (
+    SUPPORTED_FORMATS,
     convert_to_wav,
     get_supported_formats_string,
     is_supported_format,
@@ -31,13 +32,23 @@ from dictator.services.audio_converter import (
 
 logger = logging.getLogger(__name__)
 
+# Built once; the dialog filter and the instructions label never change
+_SUPPORTED_FORMATS_LABEL = get_supported_formats_string()
+_AUDIO_FILE_FILTER = (
+    "Audio Files ("
+    + " ".join(f"*{fmt}" for fmt in sorted(SUPPORTED_FORMATS))
+    + ");;All Files (*)"
+)
+
 
 class ProcessingSignals(QObject):
     """Signals for communicating from worker thread to UI."""
 
     status_updated = pyqtSignal(str)
+    partial_text = pyqtSignal(str)
     processing_complete = pyqtSignal(str, str, bool, bool)
     processing_failed = pyqtSignal(str)
+    insertion_complete = pyqtSignal(bool)
 
 
 class FileProcessorWindow(QWidget):
@@ -54,11 +65,17 @@ class FileProcessorWindow(QWidget):
         self.signals = ProcessingSignals()
         self.processing = False
         self.converted_file: Optional[Path] = None
+        self._inserter = None  # Lazy initialization
+        # One long-lived worker; files are processed in submission order
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-process")
+        self._current_future: Optional[Future] = None
 
         # Connect signals
         self.signals.status_updated.connect(self._on_status_update)
+        self.signals.partial_text.connect(self._on_partial_text)
         self.signals.processing_complete.connect(self._on_processing_complete)
         self.signals.processing_failed.connect(self._on_processing_failed)
+        self.signals.insertion_complete.connect(self._on_insertion_complete)
 
         self._init_ui()
 
@@ -73,7 +90,7 @@ class FileProcessorWindow(QWidget):
         # Instructions
         instructions = QLabel(
             f"Select an audio file to transcribe.\n"
-            f"Supported formats: {get_supported_formats_string()}"
+            f"Supported formats: {_SUPPORTED_FORMATS_LABEL}"
         )
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
@@ -137,11 +154,13 @@ class FileProcessorWindow(QWidget):
 
     def _select_file(self):
         """Open file dialog to select audio file."""
+        # Native macOS picker (DontUseNativeDialog is never set)
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Audio File",
             str(Path.home()),
-            "Audio Files (*.m4a *.mp3 *.wav *.ogg *.mp4 *.flac *.aac);;All Files (*)",
+            _AUDIO_FILE_FILTER,
+            options=QFileDialog.Option.ReadOnly,
         )
 
         if file_path:
@@ -173,26 +192,35 @@ class FileProcessorWindow(QWidget):
 
         self.processing = True
         self._update_ui_processing_state(True)
+        self.result_text.clear()
+
+        # Queue on the background worker
+        self._current_future = self._worker.submit(
+            self._process_in_background, self.selected_file
+        )
 
-        # Start processing in background thread
-        thread = threading.Thread(target=self._process_in_background, daemon=True)
-        thread.start()
+    def _process_in_background(self, source_file: Path):
+        """Process audio file on the background worker.
 
-    def _process_in_background(self):
-        """Process audio file in background thread."""
+        Args:
+            source_file: Audio file selected by the user
+        """
         try:
             # Step 1: Convert to WAV if needed
             self.signals.status_updated.emit("Converting audio format...")
 
             wav_path, duration = convert_to_wav(
-                self.selected_file,
+                source_file,
                 output_dir=self.audio_processor.storage.recordings_dir,
             )
             self.converted_file = wav_path
 
             # Step 2: Process through pipeline
             result = self.audio_processor.process(
-                wav_path, duration, progress_callback=self.signals.status_updated.emit
+                wav_path,
+                duration,
+                progress_callback=self.signals.status_updated.emit,
+                segment_callback=self.signals.partial_text.emit,
             )
 
             # Step 3: Signal completion
@@ -216,6 +244,19 @@ class FileProcessorWindow(QWidget):
         self.status_label.setText(status)
         logger.info(f"Processing status: {status}")
 
+    def _on_partial_text(self, segment_text: str):
+        """Append a transcript segment as it arrives from the worker thread.
+
+        Replaced by the final (cleaned) text when processing completes.
+
+        Args:
+            segment_text: Raw text of one Whisper segment
+        """
+        cursor = self.result_text.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(segment_text)
+        self.result_text.setTextCursor(cursor)
+
     def _on_processing_complete(
         self, raw_text: str, cleaned_text: str, inserted: bool, correction_failed: bool
     ):
@@ -297,21 +338,38 @@ class FileProcessorWindow(QWidget):
     def _insert_text(self):
         """Insert result text into focused application."""
         if hasattr(self, "cleaned_text"):
-            from dictator.insertion import TextInserter
-
-            inserter = TextInserter()
-            success = inserter.insert_text(self.cleaned_text)
-
-            if success:
-                self.status_label.setText("✅ Text inserted!")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
-                logger.info("Text inserted successfully")
-            else:
-                self.status_label.setText(
-                    "⚠️ Insertion failed - copied to clipboard instead"
+            if self._inserter is None:
+                from dictator.insertion import TextInserter
+
+                self._inserter = TextInserter()
+
+            # Insert off the UI thread; result comes back via signal
+            self.insert_btn.setEnabled(False)
+            future = self._inserter.insert_text_async(self.cleaned_text)
+            future.add_done_callback(
+                lambda f: self.signals.insertion_complete.emit(
+                    f.exception() is None and f.result()
                 )
-                self.status_label.setStyleSheet("color: orange; font-weight: bold;")
-                self._copy_to_clipboard()
+            )
+
+    def _on_insertion_complete(self, success: bool):
+        """Handle text insertion result from worker thread.
+
+        Args:
+            success: Whether text was inserted
+        """
+        self.insert_btn.setEnabled(True)
+
+        if success:
+            self.status_label.setText("✅ Text inserted!")
+            self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            logger.info("Text inserted successfully")
+        else:
+            self.status_label.setText(
+                "⚠️ Insertion failed - copied to clipboard instead"
+            )
+            self.status_label.setStyleSheet("color: orange; font-weight: bold;")
+            self._copy_to_clipboard()
 
     def closeEvent(self, event):
         """Handle window close event.
@@ -319,15 +377,16 @@ class FileProcessorWindow(QWidget):
         Args:
             event: Close event
         """
-        # Clean up converted file if it exists
-        if self.converted_file and self.converted_file.exists():
-            if self.converted_file != getattr(self, "selected_file", None):
-                try:
-                    # Only delete if it was a converted file, not the original
-                    if "_converted" in self.converted_file.name:
-                        logger.info(f"Cleaning up converted file: {self.converted_file}")
-                        # Note: We keep the file for history - don't delete
-                except Exception as e:
-                    logger.warning(f"Failed to clean up converted file: {e}")
+        # Drop work that hasn't started; a running transcription finishes.
+        # The executor stays up because the window is reused when reopened.
+        if self._current_future is not None and self._current_future.cancel():
+            logger.info("Cancelled queued file processing")
+            self.processing = False
+            self._update_ui_processing_state(False)
+        self._current_future = None
+
+        # Converted files stay for history; only orphaned old ones are removed.
+        # Queued behind any running job so it never races a conversion.
+        self._worker.submit(self.audio_processor.storage.prune_converted)
 
         event.accept()
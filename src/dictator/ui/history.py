@@ -4,21 +4,334 @@ Shows recordings in a table with copy buttons.
 """
 
 import logging
-from datetime import datetime
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import List, Optional
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QApplication,
-    QMessageBox,
+    QMainWindow, QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView,
+    QAbstractItemView, QApplication, QMessageBox, QStyledItemDelegate,
+    QStyle, QStyleOptionButton, QToolTip,
+)
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QEvent, QObject, QRect, QSize, QTimer,
+    pyqtSignal,
 )
-from PyQt6.QtCore import Qt
 
+from dictator.models import Recording
 from dictator.storage import RecordingStorage
 from dictator.services.llm_corrector import LLMCorrector
 
 logger = logging.getLogger(__name__)
 
+# Recordings loaded per page (first page on open, then on scroll to bottom)
+HISTORY_PAGE_SIZE = 50
+
+# Placeholder text shown instead of the table
+LOADING_TEXT = "Loading…"
+EMPTY_TEXT = "No recordings yet. Press Option+Space to create your first recording!"
+
+# Timestamp formats by age
+TODAY_FORMAT = "Today %H:%M"
+YESTERDAY_FORMAT = "Yesterday %H:%M"
+WEEKDAY_FORMAT = "%A %H:%M"
+DATE_FORMAT = "%b %d, %H:%M"
+
+# Table columns
+TIME_COLUMN = 0
+TEXT_COLUMN = 1
+STATUS_COLUMN = 2
+ACTIONS_COLUMN = 3
+COLUMN_HEADERS = ("Time", "Recording", "Status", "")
+
+# Item flags per column, combined once instead of on every flags() call
+_COLUMN_FLAGS = (
+    Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable,  # Time
+    Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable,  # Recording
+    Qt.ItemFlag.ItemIsEnabled,  # Status
+    Qt.ItemFlag.ItemIsEnabled,  # Actions
+)
+
+# Action button geometry within the actions cell
+ACTIONS_COLUMN_WIDTH = 180
+BUTTON_WIDTH = 35
+BUTTON_HEIGHT = 30
+BUTTON_MARGIN = 5
+BUTTON_SPACING = 5
+
+# Above this many changed rows, reset the model instead of signalling per row
+BULK_RESET_ROWS = 20
+
+# Uniform row height; rows aren't measured, long text is elided instead
+ROW_HEIGHT = 56
+
+
+def _format_timestamp(dt: datetime, now: datetime, today: date) -> str:
+    """Format timestamp for display.
+
+    Args:
+        dt: Datetime to format
+        now: Current time (captured once per load)
+        today: now.date()
+
+    Returns:
+        Formatted string
+    """
+    if dt.date() == today:
+        return dt.strftime(TODAY_FORMAT)
+
+    days_ago = (now - dt).days
+    if days_ago == 1:
+        return dt.strftime(YESTERDAY_FORMAT)
+    elif days_ago < 7:
+        return dt.strftime(WEEKDAY_FORMAT)
+    else:
+        return dt.strftime(DATE_FORMAT)
+
+
+class RecordingsModel(QAbstractTableModel):
+    """Table model over a list of recordings.
+
+    Cell text is produced on demand in data(), so only rows the view
+    actually paints are formatted.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize an empty model.
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._rows: List[Recording] = []
+        # Time column text, parallel to self._rows. Formatted once per load
+        # because data() runs on every repaint of a visible cell.
+        self._time_labels: List[str] = []
+        # Recording column text, parallel to self._rows (see recording_changed)
+        self._display_texts: List[str] = []
+        # Clock captured by set_recordings(), so "Today"/"Yesterday" labels
+        # stay consistent across pages
+        self._now = datetime.now()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of recordings (0 for child indexes)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns (0 for child indexes)."""
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Column titles for the horizontal header."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Item flags (time and text cells are selectable)."""
+        return _COLUMN_FLAGS[index.column()]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Cell text for the display and tooltip roles.
+
+        Args:
+            index: Cell index
+            role: Data role
+
+        Returns:
+            Display string, or None
+        """
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            row = index.row()
+            if column == TIME_COLUMN:
+                return self._time_labels[row]
+            if column == TEXT_COLUMN:
+                return self._display_texts[row]
+            if column == STATUS_COLUMN:
+                return "✓ Corrected" if self._rows[row].cleaned_transcription else "Raw"
+        elif role == Qt.ItemDataRole.ToolTipRole and column == TEXT_COLUMN:
+            # Rows are a fixed height, so show elided text in full on hover
+            return self._display_texts[index.row()]
+        return None  # Actions column is painted by ActionButtonsDelegate
+
+    def recording(self, row: int) -> Recording:
+        """Get the recording shown in a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Recording for that row
+        """
+        return self._rows[row]
+
+    def recording_changed(self, recording: Recording) -> None:
+        """Repaint the row of a recording that was updated in place.
+
+        Args:
+            recording: Recording object shown in the model
+        """
+        self.recordings_changed([recording])
+
+    def recordings_changed(self, recordings: List[Recording]) -> None:
+        """Repaint the rows of recordings that were updated in place.
+
+        A few rows get a dataChanged each; past BULK_RESET_ROWS a single
+        model reset is cheaper than that many signals.
+
+        Args:
+            recordings: Recording objects shown in the model
+        """
+        changed = {id(rec) for rec in recordings}
+        rows = [row for row, rec in enumerate(self._rows) if id(rec) in changed]
+        if not rows:
+            return
+
+        if len(rows) > BULK_RESET_ROWS:
+            self.beginResetModel()
+            for row in rows:
+                self._display_texts[row] = self._rows[row].display_text
+            self.endResetModel()
+            return
+
+        for row in rows:
+            self._display_texts[row] = self._rows[row].display_text
+            self.dataChanged.emit(self.index(row, TEXT_COLUMN), self.index(row, STATUS_COLUMN))
+
+    def set_recordings(self, recordings: List[Recording]) -> None:
+        """Replace all rows.
+
+        Args:
+            recordings: Recordings to show, newest first
+        """
+        self.beginResetModel()
+        self._rows = list(recordings)
+        self._now = datetime.now()
+        self._time_labels = self._format_times(recordings)
+        self._display_texts = [rec.display_text for rec in recordings]
+        self.endResetModel()
+
+    def append_recordings(self, recordings: List[Recording]) -> None:
+        """Append rows after the existing ones.
+
+        Args:
+            recordings: Older recordings to add, newest first
+        """
+        if not recordings:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(recordings) - 1)
+        self._rows.extend(recordings)
+        self._time_labels.extend(self._format_times(recordings))
+        self._display_texts.extend(rec.display_text for rec in recordings)
+        self.endInsertRows()
+
+    def _format_times(self, recordings: List[Recording]) -> List[str]:
+        """Format the time column for a batch of recordings.
+
+        Args:
+            recordings: Recordings to format
+
+        Returns:
+            Time labels in the same order
+        """
+        now = self._now
+        today = now.date()
+        return [_format_timestamp(rec.timestamp, now, today) for rec in recordings]
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """Paints the copy/re-run buttons in the actions column and handles clicks.
+
+    Buttons are drawn with the widget style instead of being real
+    QPushButtons, so rows carry no child widgets or signal connections.
+    """
+
+    copy_clicked = pyqtSignal(int)  # row
+    rerun_clicked = pyqtSignal(int)  # row
+
+    def __init__(self, parent=None):
+        """Initialize delegate.
+
+        Args:
+            parent: Parent QObject (the view)
+        """
+        super().__init__(parent)
+        self.show_rerun = False
+
+    def _buttons(self, cell: QRect):
+        """Lay out the buttons in a cell.
+
+        Args:
+            cell: Cell rectangle
+
+        Returns:
+            List of (signal, glyph, tooltip, rect) tuples
+        """
+        buttons = [(self.copy_clicked, "📋", "Copy to clipboard")]
+        if self.show_rerun:
+            buttons.append((self.rerun_clicked, "⟳", "Re-run LLM correction"))
+
+        x = cell.left() + BUTTON_MARGIN
+        y = cell.top() + BUTTON_MARGIN
+        layout = []
+        for signal, glyph, tooltip in buttons:
+            layout.append((signal, glyph, tooltip, QRect(x, y, BUTTON_WIDTH, BUTTON_HEIGHT)))
+            x += BUTTON_WIDTH + BUTTON_SPACING
+        return layout
+
+    def paint(self, painter, option, index):
+        """Paint the cell background, then the buttons."""
+        super().paint(painter, option, index)
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        for _, glyph, _, rect in self._buttons(option.rect):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = glyph
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index) -> QSize:
+        """Room for the buttons plus margins."""
+        return QSize(ACTIONS_COLUMN_WIDTH, BUTTON_HEIGHT + 2 * BUTTON_MARGIN)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Emit the matching signal when a button is clicked."""
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            pos = event.position().toPoint()
+            for signal, _, _, rect in self._buttons(option.rect):
+                if rect.contains(pos):
+                    signal.emit(index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        """Show the tooltip of the button under the cursor."""
+        if event.type() == QEvent.Type.ToolTip:
+            for _, _, tooltip, rect in self._buttons(option.rect):
+                if rect.contains(event.pos()):
+                    QToolTip.showText(event.globalPos(), tooltip, view)
+                    return True
+            QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class CorrectionSignals(QObject):
+    """Signals for reporting re-run corrections from the worker thread."""
+
+    correction_finished = pyqtSignal(object, str)  # recording, cleaned text
+    correction_failed = pyqtSignal(object, str)  # recording, error message
+
 
 class HistoryWindow(QMainWindow):
     """Qt-based history window with table layout."""
@@ -36,16 +349,35 @@ class HistoryWindow(QMainWindow):
         self.setWindowTitle("Dictator History")
         self.setGeometry(100, 100, 1000, 600)
 
+        # Re-run corrections go to Bedrock off the UI thread
+        self._correction_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-correct")
+        self._pending_corrections = 0
+        self.signals = CorrectionSignals()
+        self.signals.correction_finished.connect(self._on_correction_done)
+        self.signals.correction_failed.connect(self._on_correction_failed)
+
         # Create main widget and layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        # Shown instead of the table while loading or when there are no recordings
+        self.empty_label = QLabel(LOADING_TEXT)
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.empty_label)
+
         # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Time", "Recording", "Status", ""])
+        self.model = RecordingsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+
+        # Copy/re-run buttons are painted by a delegate, not per-row widgets
+        self.actions_delegate = ActionButtonsDelegate(self.table)
+        self.actions_delegate.show_rerun = self.llm_corrector is not None
+        self.actions_delegate.copy_clicked.connect(self._on_copy_clicked)
+        self.actions_delegate.rerun_clicked.connect(self._on_rerun_clicked)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.actions_delegate)
 
         # Configure table
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
@@ -56,87 +388,82 @@ class HistoryWindow(QMainWindow):
 
         # Set column widths
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        self.table.setColumnWidth(3, 180)
+        header.setSectionResizeMode(TIME_COLUMN, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(TEXT_COLUMN, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(STATUS_COLUMN, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(ACTIONS_COLUMN, QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(ACTIONS_COLUMN, ACTIONS_COLUMN_WIDTH)
+
+        # Fixed row height: Qt paints only visible rows instead of measuring
+        # every row's wrapped text on show
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+        self.table.setVisible(False)  # Until the first load
+        layout.addWidget(self.table)
 
-        # Enable word wrap
-        self.table.setWordWrap(True)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Inline status line for re-run corrections
+        self.status_label = QLabel("")
+        self.status_label.setContentsMargins(8, 4, 8, 4)
+        layout.addWidget(self.status_label)
 
-        layout.addWidget(self.table)
+        # Page in older recordings when scrolled to the bottom
+        self._has_more = False
+        self.table.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
-        # Load recordings
-        self.load_recordings()
+        # Recordings are loaded after the window first paints (see showEvent)
+        self._loaded = False
+
+    def showEvent(self, event):
+        """Load recordings on first show, after the window has painted.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            QTimer.singleShot(0, self.load_recordings)
 
     def load_recordings(self):
-        """Load and display all recordings in table."""
-        recordings = self.storage.load_all()
+        """Load and display the newest recordings in table.
 
-        if not recordings:
-            self.table.setRowCount(1)
-            item = QTableWidgetItem("No recordings yet. Press Option+Space to create your first recording!")
-            item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(0, 1, item)
-            self.table.setSpan(0, 0, 1, 3)
-            return
+        Older recordings are loaded a page at a time as the user scrolls.
+        """
+        recordings = self.storage.load_recent(HISTORY_PAGE_SIZE)
+        self.model.set_recordings(recordings)
 
-        # Sort newest first
-        recordings = sorted(recordings, key=lambda r: r.timestamp, reverse=True)
-
-        # Show last 50
-        recordings = recordings[:50]
-        self.table.setRowCount(len(recordings))
-
-        # Populate table
-        for row, rec in enumerate(recordings):
-            # Time column
-            time_item = QTableWidgetItem(self._format_timestamp(rec.timestamp))
-            time_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.table.setItem(row, 0, time_item)
-
-            # Recording text column - show cleaned version if available
-            display_text = rec.cleaned_transcription if rec.cleaned_transcription else rec.transcription
-            text_item = QTableWidgetItem(display_text)
-            text_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.table.setItem(row, 1, text_item)
-
-            # Status column
-            if rec.cleaned_transcription:
-                status_item = QTableWidgetItem("✓ Corrected")
-            else:
-                status_item = QTableWidgetItem("Raw")
-            status_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 2, status_item)
+        self._has_more = len(recordings) == HISTORY_PAGE_SIZE
 
-            # Action buttons - centered in a container
-            button_container = QWidget()
-            button_layout = QHBoxLayout(button_container)
-            button_layout.setContentsMargins(5, 5, 5, 5)
-            button_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-            button_layout.setSpacing(5)
+        self._loaded = True
+        self.empty_label.setText(EMPTY_TEXT)
+        self.empty_label.setVisible(not recordings)
+        self.table.setVisible(bool(recordings))
 
-            copy_btn = QPushButton("📋")
-            copy_btn.setFixedSize(35, 30)
-            copy_btn.setToolTip("Copy to clipboard")
-            copy_btn.clicked.connect(lambda checked, text=display_text: self._copy_to_clipboard(text))
-            button_layout.addWidget(copy_btn)
+        logger.info("Loaded %d recordings into history window", len(recordings))
 
-            # Add re-run correction button if LLM corrector is available
-            if self.llm_corrector:
-                rerun_btn = QPushButton("⟳")
-                rerun_btn.setFixedSize(35, 30)
-                rerun_btn.setToolTip("Re-run LLM correction")
-                rerun_btn.clicked.connect(lambda checked, r=rec: self._rerun_correction(r))
-                button_layout.addWidget(rerun_btn)
+    def _load_more(self):
+        """Append the next page of older recordings."""
+        # Continue after the last row shown, so recordings saved while the
+        # window is open don't shift the page and repeat a row
+        last = self.model.recording(self.model.rowCount() - 1)
+        recordings = self.storage.load_recent(HISTORY_PAGE_SIZE, before=last)
+        self.model.append_recordings(recordings)
 
-            button_layout.addStretch()
+        self._has_more = len(recordings) == HISTORY_PAGE_SIZE
 
-            self.table.setCellWidget(row, 3, button_container)
+        logger.info("Loaded %d more recordings into history window", len(recordings))
 
-        logger.info(f"Loaded {len(recordings)} recordings into history window")
+    def _on_scroll(self, value: int):
+        """Load the next page when scrolled to the bottom.
+
+        Args:
+            value: Vertical scrollbar position
+        """
+        if self._has_more and value >= self.table.verticalScrollBar().maximum():
+            self._load_more()
 
     def set_llm_corrector(self, corrector: Optional[LLMCorrector]):
         """Update the LLM corrector and reload recordings.
@@ -145,21 +472,41 @@ class HistoryWindow(QMainWindow):
             corrector: New LLM corrector instance
         """
         self.llm_corrector = corrector
+        self.actions_delegate.show_rerun = corrector is not None
         self.load_recordings()
 
+    def _on_copy_clicked(self, row: int):
+        """Copy a row's text to clipboard.
+
+        Args:
+            row: Table row whose copy button was clicked
+        """
+        self._copy_to_clipboard(self.model.recording(row).display_text)
+
+    def _on_rerun_clicked(self, row: int):
+        """Re-run LLM correction for a row.
+
+        Args:
+            row: Table row whose re-run button was clicked
+        """
+        self._rerun_correction(self.model.recording(row))
+
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard.
 
         Args:
             text: Text to copy
         """
-        clipboard = QApplication.clipboard()
+        clipboard = QGuiApplication.clipboard()
         clipboard.setText(text)
-        logger.info(f"Copied to clipboard: {text[:50]}...")
+        logger.info("Copied to clipboard: %.50s...", text)
 
     def _rerun_correction(self, recording):
         """Re-run LLM correction on a recording.
 
+        The Bedrock call runs on a worker thread; the result comes back via
+        signal and is applied in _on_correction_done.
+
         Args:
             recording: Recording object to correct
         """
@@ -171,56 +518,64 @@ class HistoryWindow(QMainWindow):
             )
             return
 
-        try:
-            # Show progress
-            QMessageBox.information(
-                self,
-                "Running Correction",
-                "Correcting transcript...\n\nThis may take a few seconds.",
-            )
+        # Inline status; the window stays usable meanwhile
+        self._pending_corrections += 1
+        self.status_label.setText("Correcting…")
+
+        def report(future):
+            """Hand the result to the main thread via signal."""
+            if future.exception() is not None:
+                self.signals.correction_failed.emit(recording, str(future.exception()))
+            else:
+                self.signals.correction_finished.emit(recording, future.result())
+
+        # A re-run must reach the model, not return this session's cached
+        # result or the local short-transcript fixup
+        future = self._correction_worker.submit(
+            self.llm_corrector.correct, recording.transcription, use_cache=False, local_fixup=False
+        )
+        future.add_done_callback(report)
 
-            # Run correction
-            cleaned_text = self.llm_corrector.correct(recording.transcription)
+    def _on_correction_done(self, recording, cleaned_text: str):
+        """Store a finished correction (main thread).
 
+        Args:
+            recording: Recording that was corrected
+            cleaned_text: Corrected transcript
+        """
+        self._pending_corrections -= 1
+        try:
             # Update recording
             recording.cleaned_transcription = cleaned_text
             self.storage.update(recording)
+        except Exception as e:
+            self._on_correction_failed(recording, str(e), pending=False)
+            return
 
-            # Reload UI
-            self.load_recordings()
-
-            QMessageBox.information(
-                self,
-                "Correction Complete",
-                "Transcript has been corrected successfully!",
-            )
+        # Repaint just this row
+        self.model.recording_changed(recording)
 
-            logger.info(f"Re-ran correction for recording: {recording.audio_path}")
+        logger.info("Re-ran correction for recording: %s", recording.audio_path)
 
-        except Exception as e:
-            logger.error(f"Failed to re-run correction: {e}")
-            QMessageBox.critical(
-                self,
-                "Correction Failed",
-                f"Failed to correct transcript:\n\n{str(e)}",
-            )
+        if self._pending_corrections == 0:
+            self.status_label.setText("✓ Transcript corrected")
 
-    def _format_timestamp(self, dt: datetime) -> str:
-        """Format timestamp for display.
+    def _on_correction_failed(self, recording, error: str, pending: bool = True):
+        """Report a failed correction (main thread).
 
         Args:
-            dt: Datetime to format
-
-        Returns:
-            Formatted string
-        """
-        now = datetime.now()
-
-        if dt.date() == now.date():
-            return dt.strftime("Today %H:%M")
-        elif (now - dt).days == 1:
-            return dt.strftime("Yesterday %H:%M")
-        elif (now - dt).days < 7:
-            return dt.strftime("%A %H:%M")
-        else:
-            return dt.strftime("%b %d, %H:%M")
+            recording: Recording that failed to correct
+            error: Error message
+            pending: Whether the correction was still counted as pending
+        """
+        if pending:
+            self._pending_corrections -= 1
+        if self._pending_corrections == 0:
+            self.status_label.setText("✗ Correction failed")
+
+        logger.error("Failed to re-run correction: %s", error)
+        QMessageBox.critical(
+            self,
+            "Correction Failed",
+            f"Failed to correct transcript:\n\n{error}",
+        )
@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal, QObject
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -13,7 +14,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
 )
 
-from dictator.services.model_manager import WhisperModelManager, ModelInfo
+from dictator.services.model_manager import ModelInfo, WhisperModelManager, get_manager
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +26,22 @@ class DownloadSignals(QObject):
     """
 
     download_completed = pyqtSignal(bool, str)  # success, message
+    download_progress = pyqtSignal(int)  # percent
 
 
 class ModelDownloadDialog(QDialog):
     """Dialog showing model download progress."""
 
+    # Shared label fonts, built on first use (needs a QApplication)
+    _TITLE_FONT: Optional[QFont] = None
+    _STATUS_FONT: Optional[QFont] = None
+
     def __init__(
         self,
         model_name: str,
         model_info: Optional[ModelInfo] = None,
         parent=None,
+        model_manager: Optional[WhisperModelManager] = None,
     ):
         """Initialize download dialog.
 
@@ -42,16 +49,18 @@ class ModelDownloadDialog(QDialog):
             model_name: Name of model being downloaded
             model_info: Optional model metadata
             parent: Parent widget
+            model_manager: Manager to download with (defaults to the shared one)
         """
         super().__init__(parent)
         self.model_name = model_name
         self.model_info = model_info
-        self.model_manager = WhisperModelManager()
-        self.download_thread = None
+        self.model_manager = model_manager or get_manager()
+        self.download_future = None
         self.signals = DownloadSignals()
 
-        # Connect signal
+        # Connect signals
         self.signals.download_completed.connect(self._on_completed)
+        self.signals.download_progress.connect(self._on_progress)
 
         self._init_ui()
 
@@ -75,10 +84,7 @@ class ModelDownloadDialog(QDialog):
 
         self.title_label = QLabel(title)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        font = self.title_label.font()
-        font.setPointSize(14)
-        font.setBold(True)
-        self.title_label.setFont(font)
+        self.title_label.setFont(self._title_font())
         layout.addWidget(self.title_label)
 
         # Subtitle with size info
@@ -86,14 +92,17 @@ class ModelDownloadDialog(QDialog):
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.subtitle_label)
 
-        # Status label (simple text, no progress bar)
+        # Status label
         self.status_label = QLabel("Downloading...")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_font = self.status_label.font()
-        status_font.setPointSize(12)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(self._status_font())
         layout.addWidget(self.status_label)
 
+        # Progress bar (percent updates come from the download thread)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        layout.addWidget(self.progress_bar)
+
         # Spacer
         layout.addStretch()
 
@@ -109,13 +118,31 @@ class ModelDownloadDialog(QDialog):
 
         self.setLayout(layout)
 
+    @classmethod
+    def _title_font(cls) -> QFont:
+        """Get the 14pt bold title font."""
+        if cls._TITLE_FONT is None:
+            cls._TITLE_FONT = QFont()
+            cls._TITLE_FONT.setPointSize(14)
+            cls._TITLE_FONT.setBold(True)
+        return cls._TITLE_FONT
+
+    @classmethod
+    def _status_font(cls) -> QFont:
+        """Get the 12pt status font."""
+        if cls._STATUS_FONT is None:
+            cls._STATUS_FONT = QFont()
+            cls._STATUS_FONT.setPointSize(12)
+        return cls._STATUS_FONT
+
     def start_download(self):
         """Start the model download."""
         logger.info("Starting download dialog", extra={"model": self.model_name})
 
-        self.download_thread = self.model_manager.download_model_async(
+        self.download_future = self.model_manager.download_model_async(
             model_name=self.model_name,
             completion_callback=self._completion_callback,
+            progress_callback=self.signals.download_progress.emit,
         )
 
     def _completion_callback(self, success: bool, message: str):
@@ -128,6 +155,14 @@ class ModelDownloadDialog(QDialog):
         # Emit signal to update UI from main thread
         self.signals.download_completed.emit(success, message)
 
+    def _on_progress(self, percent: int):
+        """Update the progress bar in main thread.
+
+        Args:
+            percent: Percentage downloaded
+        """
+        self.progress_bar.setValue(percent)
+
     def _on_completed(self, success: bool, message: str):
         """Handle download completion in main thread.
 
@@ -136,6 +171,7 @@ class ModelDownloadDialog(QDialog):
             message: Status message
         """
         if success:
+            self.progress_bar.setValue(100)
             self.status_label.setText("✓ Download complete!")
             logger.info("Download completed successfully", extra={"model": self.model_name})
 
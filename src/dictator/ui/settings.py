@@ -1,10 +1,12 @@
 """Settings window for Dictator configuration."""
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -14,20 +16,50 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from dictator.models import AppConfig
-from dictator.services.llm_corrector import BedrockLLMProvider
-from dictator.services.model_manager import WhisperModelManager
-from dictator.ui.model_download_dialog import ModelDownloadDialog
+from dictator.services.model_manager import get_manager
 
 logger = logging.getLogger(__name__)
 
+# Non-empty lines with surrounding whitespace trimmed, found in one regex scan
+_VOCAB_RE = re.compile(r"[^\s][^\n]*[^\s]|[^\s]")
+
+# Bedrock regions offered in the region combo (it is editable for others)
+AWS_REGIONS = (
+    "us-east-1",
+    "us-west-2",
+    "eu-west-1",
+    "eu-central-1",
+    "ap-southeast-1",
+    "ap-northeast-1",
+)
+
+
+def _parse_vocab(text: str) -> list[str]:
+    """Split vocabulary text into words (one per line, ignore empty lines).
+
+    Args:
+        text: Raw text from the vocabulary box
+
+    Returns:
+        Stripped, non-empty lines
+    """
+    return _VOCAB_RE.findall(text)
+
+
+class ConnectionTestSignals(QObject):
+    """Signals for reporting the Bedrock connection test from the worker thread."""
+
+    test_finished = pyqtSignal(bool, str)  # success, message
+    test_failed = pyqtSignal(str)  # unexpected error message
+
 
 class SettingsWindow(QWidget):
     """Settings window for app configuration."""
@@ -42,9 +74,51 @@ class SettingsWindow(QWidget):
         """
         super().__init__()
         self.config = config
-        self.model_manager = WhisperModelManager()
+        self.model_manager = get_manager()
+        # Model catalog and downloaded names, read once (see _get_models_cached)
+        self._models_cache: Optional[list] = None
+        self._downloaded_set: Optional[set[str]] = None
+        # Catalog model name -> model combo index (see _populate_model_combo)
+        self._model_name_to_index: dict[str, int] = {}
+        # Status label results keyed by (combo index, combo text); cleared
+        # when the combo is refreshed
+        self._status_cache: dict[tuple[int, str], tuple[str, bool, str]] = {}
+        # Free space in the model cache, read once per showing of the window
+        # and again after a download (see _get_available_disk_space)
+        self._available_disk_space: Optional[int] = None
+        # Coalesces status updates while the model combo is being edited
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(150)
+        self._status_timer.timeout.connect(self._update_model_status)
+        # Vocabulary document revision and its parsed words (see _parsed_vocabulary)
+        self._vocab_cache: tuple[int, tuple[str, ...]] = (-1, ())
+        # Connection tests talk to AWS off the UI thread
+        self._test_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-test")
+        self.signals = ConnectionTestSignals()
+        self.signals.test_finished.connect(self._on_connection_test_done)
+        self.signals.test_failed.connect(self._on_connection_test_failed)
+        # The window is reused for the whole app run (see showEvent)
+        self._shown = False
         self.init_ui()
 
+    def showEvent(self, event):
+        """Rescan downloaded models and free space when the window is reopened.
+
+        Models can be downloaded (e.g. by the preloading transcriber) or
+        deleted, and disk space freed, while the window is hidden.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if self._shown and not event.spontaneous():
+            self._models_cache = None
+            self._downloaded_set = None
+            self._available_disk_space = None
+            self._refresh_model_combo()  # Also clears the status cache
+        self._shown = True
+
     def init_ui(self):
         """Initialize the UI components."""
         self.setWindowTitle("Dictator Settings")
@@ -80,15 +154,17 @@ class SettingsWindow(QWidget):
         model_layout = QHBoxLayout()
 
         self.whisper_model_combo = QComboBox()
-        self.whisper_model_combo.setMinimumWidth(300)
+        # Size from a character count instead of measuring every entry
+        self.whisper_model_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.whisper_model_combo.setMinimumContentsLength(40)
 
-        # Populate with models showing sizes and status
-        all_models = self.model_manager.get_all_models()
-        for model_info in all_models:
-            is_downloaded = self.model_manager.is_model_downloaded(model_info.name)
-            status_icon = "✓" if is_downloaded else "○"
-            display_text = f"{status_icon} {model_info.display_name} - {model_info.description}"
-            self.whisper_model_combo.addItem(display_text, model_info.name)
+        # Populate with models showing sizes and status (signals aren't
+        # connected yet; repaints are held until the list is complete)
+        self.whisper_model_combo.setUpdatesEnabled(False)
+        self._populate_model_combo()
+        self.whisper_model_combo.setUpdatesEnabled(True)
 
         # Set current selection
         current_index = self._find_model_index(self.config.whisper_model)
@@ -110,15 +186,20 @@ class SettingsWindow(QWidget):
         self.model_status_label = QLabel()
         self.model_status_label.setWordWrap(True)
         self._update_model_status()
-        self.whisper_model_combo.currentIndexChanged.connect(self._update_model_status)
+        # Debounced: typing a custom name fires on every keystroke
+        self.whisper_model_combo.currentIndexChanged.connect(self._status_timer.start)
+        self.whisper_model_combo.editTextChanged.connect(self._status_timer.start)
         layout.addRow("Status:", self.model_status_label)
 
         # Thread count
         self.whisper_threads_spin = QSpinBox()
-        self.whisper_threads_spin.setMinimum(1)
+        self.whisper_threads_spin.setMinimum(0)
         self.whisper_threads_spin.setMaximum(32)
+        self.whisper_threads_spin.setSpecialValueText("Auto")  # Shown for 0
         self.whisper_threads_spin.setValue(self.config.whisper_threads)
-        self.whisper_threads_spin.setToolTip("More threads = faster transcription (uses more CPU)")
+        self.whisper_threads_spin.setToolTip(
+            "Auto uses one thread per performance core. More threads than cores slows transcription."
+        )
         layout.addRow("Threads:", self.whisper_threads_spin)
 
         # Custom Vocabulary
@@ -126,8 +207,9 @@ class SettingsWindow(QWidget):
         vocab_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         vocab_label.setToolTip("One word per line. Technical terms, names, jargon.")
 
-        self.vocabulary_edit = QTextEdit()
+        self.vocabulary_edit = QPlainTextEdit()
         self.vocabulary_edit.setPlainText("\n".join(self.config.custom_vocabulary))
+        self.vocabulary_edit.setUndoRedoEnabled(False)  # Word lists can be long; no undo history
         self.vocabulary_edit.setPlaceholderText("Docker\nKubernetes\nPostgreSQL\nAWS\nBedrock")
         self.vocabulary_edit.setMaximumHeight(100)
         self.vocabulary_edit.setToolTip("Words Whisper should recognize (one per line)")
@@ -188,6 +270,58 @@ class SettingsWindow(QWidget):
         self.silence_threshold_spin.setEnabled(checked)
         self.min_silence_duration_spin.setEnabled(checked)
 
+    def _get_models_cached(self) -> tuple[list, set[str]]:
+        """Get the model catalog and the set of downloaded model names.
+
+        The cache directory is scanned once instead of stat-ing each model;
+        _download_selected_model invalidates the cache.
+
+        Returns:
+            Tuple of (ModelInfo list sorted by size, downloaded model names)
+        """
+        if self._models_cache is None:
+            self._models_cache = self.model_manager.get_all_models()
+            self._downloaded_set = set(
+                self.model_manager.get_downloaded_models(self.config.whisper_quantization)
+            )
+        return self._models_cache, self._downloaded_set
+
+    def _is_model_downloaded(self, model_name: str) -> bool:
+        """Check download status, using the cached scan for catalog models.
+
+        Catalog models are checked for the file the transcriber loads, i.e.
+        the variant for the configured quantization.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            True if the model file is present
+        """
+        _, downloaded = self._get_models_cached()
+        if model_name in downloaded:
+            return True
+        if self.model_manager.get_model_info(model_name):
+            return False
+        return self.model_manager.is_model_downloaded(model_name)  # Custom model
+
+    def _populate_model_combo(self):
+        """Add an entry per catalog model, marked with its download status."""
+        models, downloaded = self._get_models_cached()
+        texts = [
+            f"{'✓' if m.name in downloaded else '○'} {m.display_name} - {m.description}"
+            for m in models
+        ]
+
+        # One batch insert, then attach the model names as item data
+        combo = self.whisper_model_combo
+        first = combo.count()
+        combo.addItems(texts)
+        self._model_name_to_index = {}
+        for i, model_info in enumerate(models, start=first):
+            combo.setItemData(i, model_info.name)
+            self._model_name_to_index[model_info.name] = i
+
     def _find_model_index(self, model_name: str) -> int:
         """Find index of model in combo box by name.
 
@@ -197,10 +331,7 @@ class SettingsWindow(QWidget):
         Returns:
             Index in combo box, or -1 if not found
         """
-        for i in range(self.whisper_model_combo.count()):
-            if self.whisper_model_combo.itemData(i) == model_name:
-                return i
-        return -1
+        return self._model_name_to_index.get(model_name, -1)
 
     def _get_selected_model_name(self) -> str:
         """Get the currently selected model name.
@@ -232,46 +363,79 @@ class SettingsWindow(QWidget):
         return text
 
     def _update_model_status(self):
-        """Update the model status label."""
-        model_name = self._get_selected_model_name()
-        model_info = self.model_manager.get_model_info(model_name)
-        is_downloaded = self.model_manager.is_model_downloaded(model_name)
-
-        if is_downloaded:
-            status = "✓ <b>Downloaded</b> - Ready to use"
-            self.download_model_button.setEnabled(False)
-            self.download_model_button.setText("Downloaded")
-        else:
-            if model_info:
-                available_space = self.model_manager.get_available_disk_space()
-                space_needed = model_info.size_mb
-
-                if available_space < space_needed:
-                    status = f"⚠ <b>Not downloaded</b> - Insufficient disk space (need {space_needed}MB, have {available_space}MB)"
-                    self.download_model_button.setEnabled(False)
-                else:
-                    status = f"○ <b>Not downloaded</b> - Will download {model_info.size_mb}MB on first use or click Download"
-                    self.download_model_button.setEnabled(True)
-                    self.download_model_button.setText("Download")
-            else:
-                status = "○ <b>Not downloaded</b> - Custom model"
-                self.download_model_button.setEnabled(True)
-                self.download_model_button.setText("Download")
+        """Update the model status label and download button."""
+        combo = self.whisper_model_combo
+        key = (combo.currentIndex(), combo.currentText())
+        result = self._status_cache.get(key)
+        if result is None:
+            result = self._status_cache[key] = self._compute_model_status(
+                self._get_selected_model_name()
+            )
 
+        status, can_download, button_text = result
         self.model_status_label.setText(status)
+        self.download_model_button.setEnabled(can_download)
+        self.download_model_button.setText(button_text)
+
+    def _compute_model_status(self, model_name: str) -> tuple[str, bool, str]:
+        """Work out the status shown for a model.
+
+        Args:
+            model_name: Name of the selected model
+
+        Returns:
+            Tuple of (status HTML, download button enabled, button text)
+        """
+        if self._is_model_downloaded(model_name):
+            return "✓ <b>Downloaded</b> - Ready to use", False, "Downloaded"
+
+        model_info = self.model_manager.resolve_model_info(model_name, self.config.whisper_quantization)
+        if not model_info:
+            return "○ <b>Not downloaded</b> - Custom model", True, "Download"
+
+        available_space = self._get_available_disk_space()
+        space_needed = model_info.size_mb
+        if available_space < space_needed:
+            return (
+                f"⚠ <b>Not downloaded</b> - Insufficient disk space (need {space_needed}MB, have {available_space}MB)",
+                False,
+                "Download",
+            )
+        return (
+            f"○ <b>Not downloaded</b> - Will download {model_info.size_mb}MB on first use or click Download",
+            True,
+            "Download",
+        )
+
+    def _get_available_disk_space(self) -> int:
+        """Get free space in the model cache, read once per showing of the window.
+
+        Returns:
+            Available space in MB
+        """
+        if self._available_disk_space is None:
+            self._available_disk_space = self.model_manager.get_available_disk_space()
+        return self._available_disk_space
 
     def _download_selected_model(self):
         """Download the currently selected model."""
+        self._status_timer.stop()  # Refreshed once the dialog closes
+        # Fetch the file the transcriber will load (the quantized variant)
         model_name = self._get_selected_model_name()
-        model_info = self.model_manager.get_model_info(model_name)
+        model_info = self.model_manager.resolve_model_info(model_name, self.config.whisper_quantization)
+        if model_info:
+            model_name = model_info.name
 
         logger.info("User requested model download", extra={"model": model_name})
 
-        # Show download dialog
+        # Show download dialog (imported here; most settings sessions never download)
+        from dictator.ui.model_download_dialog import ModelDownloadDialog
+
         dialog = ModelDownloadDialog(
             model_name=model_name,
             model_info=model_info,
             parent=self,
+            model_manager=self.model_manager,
         )
 
         # Start download
@@ -280,36 +444,38 @@ class SettingsWindow(QWidget):
         # Show dialog (modal)
         result = dialog.exec()
 
-        # Update status after dialog closes
-        self._update_model_status()
+        # Download status may have changed; rescan on next use
+        self._models_cache = None
+        self._downloaded_set = None
+        self._available_disk_space = None
 
-        # Refresh combo box to update checkmarks
-        current_model = self._get_selected_model_name()
+        # Refresh combo box checkmarks and the status label
         self._refresh_model_combo()
 
-        # Restore selection
-        new_index = self._find_model_index(current_model)
-        if new_index >= 0:
-            self.whisper_model_combo.setCurrentIndex(new_index)
-
     def _refresh_model_combo(self):
         """Refresh the model combo box with updated download status."""
         # Save current selection
         current_model = self._get_selected_model_name()
+        self._status_cache.clear()
+
+        # Clear and repopulate without a repaint or currentIndexChanged
+        # (and so a status update) per inserted item
+        combo = self.whisper_model_combo
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            self._populate_model_combo()
 
-        # Clear and repopulate
-        self.whisper_model_combo.clear()
-        all_models = self.model_manager.get_all_models()
-        for model_info in all_models:
-            is_downloaded = self.model_manager.is_model_downloaded(model_info.name)
-            status_icon = "✓" if is_downloaded else "○"
-            display_text = f"{status_icon} {model_info.display_name} - {model_info.description}"
-            self.whisper_model_combo.addItem(display_text, model_info.name)
+            # Restore selection
+            new_index = self._find_model_index(current_model)
+            if new_index >= 0:
+                combo.setCurrentIndex(new_index)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
 
-        # Restore selection
-        new_index = self._find_model_index(current_model)
-        if new_index >= 0:
-            self.whisper_model_combo.setCurrentIndex(new_index)
+        self._update_model_status()
 
     def _create_llm_settings(self) -> QGroupBox:
         """Create LLM correction settings group."""
@@ -322,8 +488,23 @@ class SettingsWindow(QWidget):
         self.llm_enabled_checkbox.stateChanged.connect(self._toggle_llm_settings)
         layout.addWidget(self.llm_enabled_checkbox)
 
-        # Bedrock settings container
+        # Bedrock settings, built the first time LLM correction is enabled
         self.bedrock_container = QWidget()
+        self._llm_built = False
+        layout.addWidget(self.bedrock_container)
+
+        # Show/build based on checkbox
+        self._toggle_llm_settings()
+
+        group.setLayout(layout)
+        return group
+
+    def _build_llm_body(self):
+        """Create the Bedrock settings widgets inside bedrock_container.
+
+        Deferred until LLM correction is enabled, since most settings changes
+        never touch these (the prompt editor is the heaviest widget here).
+        """
         bedrock_layout = QFormLayout()
 
         # AWS Profile
@@ -334,14 +515,11 @@ class SettingsWindow(QWidget):
 
         # AWS Region
         self.bedrock_region_combo = QComboBox()
-        self.bedrock_region_combo.addItems([
-            "us-east-1",
-            "us-west-2",
-            "eu-west-1",
-            "eu-central-1",
-            "ap-southeast-1",
-            "ap-northeast-1",
-        ])
+        self.bedrock_region_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.bedrock_region_combo.setMinimumContentsLength(16)
+        self.bedrock_region_combo.addItems(AWS_REGIONS)
         self.bedrock_region_combo.setCurrentText(self.config.bedrock_region)
         self.bedrock_region_combo.setEditable(True)
         bedrock_layout.addRow("AWS Region:", self.bedrock_region_combo)
@@ -360,19 +538,13 @@ class SettingsWindow(QWidget):
         # Correction Prompt
         prompt_label = QLabel("Correction Prompt:")
         prompt_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.correction_prompt_edit = QTextEdit()
+        self.correction_prompt_edit = QPlainTextEdit()
         self.correction_prompt_edit.setPlainText(self.config.correction_prompt)
         self.correction_prompt_edit.setMinimumHeight(200)
         bedrock_layout.addRow(prompt_label, self.correction_prompt_edit)
 
         self.bedrock_container.setLayout(bedrock_layout)
-        layout.addWidget(self.bedrock_container)
-
-        # Enable/disable based on checkbox
-        self._toggle_llm_settings()
-
-        group.setLayout(layout)
-        return group
+        self._llm_built = True
 
     def _create_buttons(self) -> QHBoxLayout:
         """Create save/cancel buttons."""
@@ -391,39 +563,60 @@ class SettingsWindow(QWidget):
         return layout
 
     def _toggle_llm_settings(self):
-        """Enable/disable LLM settings based on checkbox."""
+        """Show/hide LLM settings based on checkbox."""
         enabled = self.llm_enabled_checkbox.isChecked()
-        self.bedrock_container.setEnabled(enabled)
+        if enabled and not self._llm_built:
+            self._build_llm_body()
+        self.bedrock_container.setVisible(enabled)
+
+    def _bedrock_settings(self) -> tuple[str, str, str, str]:
+        """Get the Bedrock settings to save.
+
+        Returns:
+            Tuple of (aws_profile, bedrock_model, bedrock_region,
+            correction_prompt), from the widgets if they were built, else
+            unchanged from the current config
+        """
+        if not self._llm_built:
+            return (
+                self.config.aws_profile,
+                self.config.bedrock_model,
+                self.config.bedrock_region,
+                self.config.correction_prompt,
+            )
+        return (
+            self.aws_profile_edit.text().strip(),
+            self.bedrock_model_edit.text().strip(),
+            self.bedrock_region_combo.currentText().strip(),
+            self.correction_prompt_edit.toPlainText().strip(),
+        )
 
     def _test_bedrock_connection(self):
         """Test AWS Bedrock connection with current settings."""
-        try:
-            # Get current values
-            profile = self.aws_profile_edit.text().strip() or None
-            model_id = self.bedrock_model_edit.text().strip()
-            region = self.bedrock_region_combo.currentText().strip()
-            prompt = self.correction_prompt_edit.toPlainText().strip()
-
-            if not model_id:
-                QMessageBox.warning(
-                    self,
-                    "Missing Model",
-                    "Please enter a Bedrock model ID",
-                )
-                return
-
-            # Get vocabulary
-            vocab_text = self.vocabulary_edit.toPlainText()
-            vocabulary = [
-                word.strip()
-                for word in vocab_text.split("\n")
-                if word.strip()
-            ]
-
-            # Test connection
-            self.test_button.setEnabled(False)
-            self.test_button.setText("Testing...")
+        # Get current values
+        profile = self.aws_profile_edit.text().strip() or None
+        model_id = self.bedrock_model_edit.text().strip()
+        region = self.bedrock_region_combo.currentText().strip()
+        prompt = self.correction_prompt_edit.toPlainText().strip()
+
+        if not model_id:
+            QMessageBox.warning(
+                self,
+                "Missing Model",
+                "Please enter a Bedrock model ID",
+            )
+            return
+
+        vocabulary = self._parsed_vocabulary()
+
+        from dictator.services.llm_corrector import BedrockLLMProvider
 
+        # Re-enabled by the result slot
+        self.test_button.setEnabled(False)
+        self.test_button.setText("Testing...")
+
+        def run_test():
+            """Create the provider and probe credentials (worker thread)."""
             provider = BedrockLLMProvider(
                 model_id=model_id,
                 correction_prompt=prompt,
@@ -431,74 +624,113 @@ class SettingsWindow(QWidget):
                 region=region,
                 custom_vocabulary=vocabulary,
             )
+            return provider.validate_credentials()
 
-            success, message = provider.validate_credentials()
-
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Connection Successful",
-                    message,
-                )
+        def report(future):
+            """Hand the result to the main thread via signal."""
+            if future.exception() is not None:
+                self.signals.test_failed.emit(str(future.exception()))
             else:
-                QMessageBox.warning(
-                    self,
-                    "Connection Failed",
-                    message,
-                )
+                self.signals.test_finished.emit(*future.result())
 
-        except Exception as e:
-            logger.error(f"Error testing Bedrock connection: {e}")
-            QMessageBox.critical(
+        future = self._test_worker.submit(run_test)
+        future.add_done_callback(report)
+
+    def _on_connection_test_done(self, success: bool, message: str):
+        """Show the connection test result (main thread).
+
+        Args:
+            success: Whether the credentials and model were usable
+            message: Result message from the provider
+        """
+        self._reset_test_button()
+
+        if success:
+            QMessageBox.information(
                 self,
-                "Test Failed",
-                f"Unexpected error: {str(e)}",
+                "Connection Check Passed",
+                message,
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Connection Failed",
+                message,
             )
 
-        finally:
-            self.test_button.setEnabled(True)
-            self.test_button.setText("Test AWS Connection")
+    def _on_connection_test_failed(self, error: str):
+        """Report an unexpected connection test error (main thread).
+
+        Args:
+            error: Error message
+        """
+        self._reset_test_button()
+
+        logger.error("Error testing Bedrock connection: %s", error)
+        QMessageBox.critical(
+            self,
+            "Test Failed",
+            f"Unexpected error: {error}",
+        )
+
+    def _reset_test_button(self):
+        """Re-enable the test button after a connection test."""
+        self.test_button.setEnabled(True)
+        self.test_button.setText("Test AWS Connection")
+
+    def _parsed_vocabulary(self) -> list[str]:
+        """Parse the vocabulary box (one word per line, ignore empty lines).
+
+        Reuses the previous result if the document hasn't been edited since.
+
+        Returns:
+            List of vocabulary words
+        """
+        revision = self.vocabulary_edit.document().revision()
+        if revision != self._vocab_cache[0]:
+            self._vocab_cache = (revision, tuple(_parse_vocab(self.vocabulary_edit.toPlainText())))
+        return list(self._vocab_cache[1])
 
     def _save_settings(self):
         """Save settings and emit signal."""
         try:
-            # Parse vocabulary (one word per line, ignore empty lines)
-            vocab_text = self.vocabulary_edit.toPlainText()
-            vocabulary = [
-                word.strip()
-                for word in vocab_text.split("\n")
-                if word.strip()
-            ]
-
-            # Get selected model name
-            selected_model = self._get_selected_model_name()
+            aws_profile, bedrock_model, bedrock_region, correction_prompt = self._bedrock_settings()
+
+            # Read each widget once; the log below reuses these values
+            params = {
+                "whisper_model": self._get_selected_model_name(),
+                "whisper_threads": self.whisper_threads_spin.value(),
+                "custom_vocabulary": self._parsed_vocabulary(),
+                "llm_correction_enabled": self.llm_enabled_checkbox.isChecked(),
+                "aws_profile": aws_profile,
+                "bedrock_model": bedrock_model,
+                "bedrock_region": bedrock_region,
+                "correction_prompt": correction_prompt,
+                "remove_silence_enabled": self.silence_removal_checkbox.isChecked(),
+                "silence_threshold": self.silence_threshold_spin.value() / 1000.0,
+                "min_silence_duration": self.min_silence_duration_spin.value() / 1000.0,
+            }
+            selected_model = params["whisper_model"]
 
             # Log what's being saved
             logger.info(
                 "Saving settings",
                 extra={
                     "whisper_model": selected_model,
-                    "whisper_threads": self.whisper_threads_spin.value(),
-                    "vocab_count": len(vocabulary),
-                    "llm_enabled": self.llm_enabled_checkbox.isChecked(),
+                    "whisper_threads": params["whisper_threads"],
+                    "vocab_count": len(params["custom_vocabulary"]),
+                    "llm_enabled": params["llm_correction_enabled"],
                 }
             )
 
-            # Create updated config
+            # Create updated config (settings not shown in this window carry over)
             updated_config = AppConfig(
                 recordings_dir=self.config.recordings_dir,
-                whisper_model=selected_model,
-                whisper_threads=self.whisper_threads_spin.value(),
-                custom_vocabulary=vocabulary,
-                llm_correction_enabled=self.llm_enabled_checkbox.isChecked(),
+                whisper_quantization=self.config.whisper_quantization,
+                whisper_process_isolation=self.config.whisper_process_isolation,
+                llm_min_words=self.config.llm_min_words,
                 llm_provider="bedrock",
-                aws_profile=self.aws_profile_edit.text().strip(),
-                bedrock_model=self.bedrock_model_edit.text().strip(),
-                bedrock_region=self.bedrock_region_combo.currentText().strip(),
-                correction_prompt=self.correction_prompt_edit.toPlainText().strip(),
-                remove_silence_enabled=self.silence_removal_checkbox.isChecked(),
-                silence_threshold=self.silence_threshold_spin.value() / 1000.0,
-                min_silence_duration=self.min_silence_duration_spin.value() / 1000.0,
+                **params,
             )
 
             logger.info(f"✓ Settings saved with Whisper model: {selected_model}")